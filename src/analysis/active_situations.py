@@ -244,13 +244,11 @@ def load_previous_situations(
         return []
 
     prev_path = Path(archive_dir) / "daily" / prev_date / "briefing.json"
-    if not prev_path.exists():
-        return []
-
     try:
-        with open(prev_path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(prev_path.read_bytes())
         return data.get("active_situations", [])
-    except (json.JSONDecodeError, OSError) as exc:
+    except FileNotFoundError:
+        return []
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError) as exc:
         logger.warning("Failed to load previous situations: %s", exc)
         return []
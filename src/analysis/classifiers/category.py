@@ -10,6 +10,8 @@ from __future__ import annotations
 import re
 from typing import Any
 
+from analysis.memo import identity_memo
+
 # Categories ordered by specificity (fewer keywords = more specific).
 # Used as a tiebreaker when two categories have the same score.
 SPECIFICITY_ORDER = [
@@ -28,39 +30,54 @@ VALID_CATEGORIES = frozenset(
 )
 
 
-def _score_text_against_keywords(
-    text: str,
-    keywords: list[str],
-    *,
-    exact_weight: int = 3,
-    partial_weight: int = 0,
-) -> int:
-    """Score a text against a list of keywords.
+_Prepared = tuple[tuple[str, bool, tuple[str, ...]], ...]
 
-    Exact match (case-insensitive word boundary) scores higher than
-    a partial (substring) match.
 
-    Args:
-        text: The text to score.
-        keywords: List of keywords to match against.
-        exact_weight: Points for an exact-word match.
-        partial_weight: Points for a substring match.
+def _prepare_keywords(keywords: list[str]) -> _Prepared:
+    """Lowercase *keywords* once: (keyword, is_single_word, partial_parts).
 
-    Returns:
-        Total score for this keyword list.
+    Single-word ASCII keywords match whole words only; multi-word and CJK
+    keywords match as substrings, with their >2-char words as partials.
     """
-    text_lower = text.lower()
-    # Build a set of words for exact matching
-    words = set(text_lower.split())
-    score = 0
-
+    prepared = []
     for keyword in keywords:
         kw_lower = keyword.lower()
+        is_cjk = any("\u4e00" <= c <= "\u9fff" for c in kw_lower)
+        parts = tuple(part for part in kw_lower.split() if len(part) > 2)
+        prepared.append((kw_lower, " " not in kw_lower and not is_cjk, parts))
+    return tuple(prepared)
+
+
+@identity_memo
+def _prepared_categories(
+    categories_dict: dict[str, dict[str, list[str]]],
+) -> tuple[tuple[str, _Prepared], ...]:
+    """Prepare each valid category's EN + ZH keywords once per table."""
+    return tuple(
+        (
+            category,
+            _prepare_keywords(lang_keywords.get("en", []))
+            + _prepare_keywords(lang_keywords.get("zh", [])),
+        )
+        for category, lang_keywords in categories_dict.items()
+        if category in VALID_CATEGORIES
+    )
+
+
+def _score_prepared(
+    text_lower: str,
+    words: set[str],
+    prepared: _Prepared,
+    exact_weight: int,
+    partial_weight: int,
+) -> int:
+    """Score lowercased text (and its word set) against prepared keywords."""
+    score = 0
+    for kw_lower, is_single_word, parts in prepared:
         # Single-word ASCII keywords: exact word match ONLY (no substring)
         # This prevents "AI" matching inside "lai", "said", etc.
         # CJK keywords need substring matching since Chinese has no word boundaries.
-        is_cjk = any("\u4e00" <= c <= "\u9fff" for c in kw_lower)
-        if " " not in kw_lower and not is_cjk:
+        if is_single_word:
             if kw_lower in words:
                 score += exact_weight
             continue
@@ -69,11 +86,8 @@ def _score_text_against_keywords(
             score += exact_weight
             continue
         # Partial match: check if any word in the keyword appears
-        kw_parts = kw_lower.split()
-        for part in kw_parts:
-            if len(part) > 2 and part in text_lower:
-                score += partial_weight
-                break
+        if partial_weight and any(part in text_lower for part in parts):
+            score += partial_weight
 
     return score
 
@@ -202,16 +216,12 @@ def classify_category(
         Defaults to "political" if no keywords match.
     """
     scores: dict[str, int] = {}
+    # Lowercase and split the text once for every keyword list.
+    text_lower = text.lower()
+    words = set(text_lower.split())
 
-    for category, lang_keywords in categories_dict.items():
-        if category not in VALID_CATEGORIES:
-            continue
-        en_keywords = lang_keywords.get("en", [])
-        zh_keywords = lang_keywords.get("zh", [])
-
-        en_score = _score_text_against_keywords(text, en_keywords)
-        zh_score = _score_text_against_keywords(text, zh_keywords)
-        scores[category] = en_score + zh_score
+    for category, keywords in _prepared_categories(categories_dict):
+        scores[category] = _score_prepared(text_lower, words, keywords, 3, 0)
 
     if not scores or max(scores.values()) == 0:
         return _fallback_category(text)
@@ -313,22 +323,8 @@ def validate_category(signal_text: str, current_category: str) -> str:
     return current_category
 
 
-def classify_signal(
-    signal: dict[str, Any],
-    categories_dict: dict[str, dict[str, list[str]]],
-) -> str:
-    """Classify a raw signal dict into a category.
-
-    Extracts text from signal's title and body fields (both EN and ZH)
-    and runs keyword classification.
-
-    Args:
-        signal: Raw signal dictionary with title, body fields.
-        categories_dict: Category keyword dictionaries.
-
-    Returns:
-        Category string.
-    """
+def _category_text(signal: dict[str, Any]) -> str:
+    """Join the title, best body field, and summary fields used for scoring."""
     parts: list[str] = []
 
     # Handle bilingual title
@@ -363,5 +359,41 @@ def classify_signal(
             parts.append(val.get("en", ""))
             parts.append(val.get("zh", ""))
 
-    combined = " ".join(parts)
-    return classify_category(combined, categories_dict)
+    return " ".join(parts)
+
+
+def validation_text(signal: dict[str, Any]) -> str:
+    """Join the title and body text checked by validate_category()."""
+    parts: list[str] = []
+    title = signal.get("title", "")
+    if isinstance(title, dict):
+        parts.extend([title.get("en", ""), title.get("zh", "")])
+    elif isinstance(title, str):
+        parts.append(title)
+    for body_key in ("body", "body_text"):
+        body = signal.get(body_key, "")
+        if isinstance(body, dict):
+            parts.extend([body.get("en", ""), body.get("zh", "")])
+        elif isinstance(body, str) and body:
+            parts.append(body)
+            break
+    return " ".join(parts)
+
+
+def classify_signal(
+    signal: dict[str, Any],
+    categories_dict: dict[str, dict[str, list[str]]],
+) -> str:
+    """Classify a raw signal dict into a category.
+
+    Extracts text from signal's title and body fields (both EN and ZH)
+    and runs keyword classification.
+
+    Args:
+        signal: Raw signal dictionary with title, body fields.
+        categories_dict: Category keyword dictionaries.
+
+    Returns:
+        Category string.
+    """
+    return classify_category(_category_text(signal), categories_dict)
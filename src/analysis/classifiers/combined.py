@@ -0,0 +1,46 @@
+"""Single-call classification of a signal's category, severity, and tier."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from analysis.classifiers.category import (
+    classify_signal,
+    validate_category,
+    validation_text,
+)
+from analysis.classifiers.severity import classify_severity
+from analysis.classifiers.source_mapper import map_signal_source_tier
+
+
+def classify_all(
+    signal: dict[str, Any],
+    categories_dict: dict[str, dict[str, list[str]]],
+    severity_modifiers: dict[str, Any] | None = None,
+) -> tuple[str, str, str]:
+    """Classify a raw signal in one pass.
+
+    Runs keyword category classification, the strong-indicator category
+    override, source tier mapping, and severity scoring (which depends on
+    the first two) in a single call.
+
+    Args:
+        signal: Raw signal dictionary.
+        categories_dict: Category keyword dictionaries.
+        severity_modifiers: Keyword modifier dictionaries.
+
+    Returns:
+        ``(category, severity, source_tier)`` tuple.
+    """
+    category = validate_category(
+        validation_text(signal), classify_signal(signal, categories_dict),
+    )
+    source_tier = map_signal_source_tier(signal)
+    severity = classify_severity(
+        signal,
+        source_tier=source_tier,
+        category=category,
+        severity_modifiers=severity_modifiers,
+        reference_date=None,
+    )
+    return category, severity, source_tier
@@ -12,6 +12,8 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Any
 
+from analysis.memo import identity_memo
+
 SOURCE_TIER_SCORES: dict[str, int] = {
     "official": 4,
     "wire": 3,
@@ -37,9 +39,32 @@ BILATERAL_KEYWORDS_ZH = [
 ]
 
 
+_MODIFIER_KEYS = ("escalation", "moderate_escalation", "de_escalation")
+
+
+@identity_memo
+def _modifier_table(
+    severity_modifiers: dict[str, Any],
+) -> tuple[tuple[int, tuple[str, ...], tuple[str, ...]], ...]:
+    """Return (weight, lowered en keywords, zh keywords) rows for scoring.
+
+    Built once per severity_modifiers dict.
+    """
+    rows = []
+    for modifier_key in _MODIFIER_KEYS:
+        modifier = severity_modifiers.get(modifier_key, {})
+        rows.append((
+            modifier.get("weight", 0),
+            tuple(kw.lower() for kw in modifier.get("en", [])),
+            tuple(modifier.get("zh", [])),
+        ))
+    return tuple(rows)
+
+
 def _keyword_modifier_score(
     text: str,
     severity_modifiers: dict[str, Any],
+    text_lower: str | None = None,
 ) -> int:
     """Score text against escalation/de-escalation keyword lists.
 
@@ -47,38 +72,25 @@ def _keyword_modifier_score(
         text: Combined text to scan.
         severity_modifiers: Dict with escalation, moderate_escalation,
             de_escalation keys, each containing en/zh lists and weight.
+        text_lower: ``text.lower()``, if the caller already has it.
 
     Returns:
         Total modifier score (can be negative for de-escalation).
     """
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
     score = 0
 
-    for modifier_key in ("escalation", "moderate_escalation", "de_escalation"):
-        modifier = severity_modifiers.get(modifier_key, {})
-        weight = modifier.get("weight", 0)
-        en_keywords = modifier.get("en", [])
-        zh_keywords = modifier.get("zh", [])
-
-        matched = False
-        for kw in en_keywords:
-            if kw.lower() in text_lower:
-                matched = True
-                break
-
-        if not matched:
-            for kw in zh_keywords:
-                if kw in text:
-                    matched = True
-                    break
-
-        if matched:
+    for weight, en_keywords, zh_keywords in _modifier_table(severity_modifiers):
+        if any(kw in text_lower for kw in en_keywords) or any(
+            kw in text for kw in zh_keywords
+        ):
             score += weight
 
     return score
 
 
-def _bilateral_score(text: str) -> int:
+def _bilateral_score(text: str, text_lower: str | None = None) -> int:
     """Score bilateral directness.
 
     Returns:
@@ -86,7 +98,8 @@ def _bilateral_score(text: str) -> int:
         1 if mentions China generally,
         0 otherwise.
     """
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
 
     for kw in BILATERAL_KEYWORDS_EN:
         if kw in text_lower:
@@ -159,16 +172,17 @@ def compute_severity_score(
         Raw integer score.
     """
     score = 0
+    text_lower = text.lower()
 
     # Factor 1: Source reliability
     score += SOURCE_TIER_SCORES.get(source_tier, 1)
 
     # Factor 2: Escalation keywords
     if severity_modifiers:
-        score += _keyword_modifier_score(text, severity_modifiers)
+        score += _keyword_modifier_score(text, severity_modifiers, text_lower)
 
     # Factor 3: Bilateral directness
-    score += _bilateral_score(text)
+    score += _bilateral_score(text, text_lower)
 
     # Factor 4: Recency
     if signal_date:
@@ -192,25 +206,8 @@ def score_to_severity(score: int) -> str:
     return "low"
 
 
-def classify_severity(
-    signal: dict[str, Any],
-    source_tier: str,
-    category: str,
-    severity_modifiers: dict[str, Any] | None = None,
-    reference_date: date | None = None,
-) -> str:
-    """Classify a signal's severity level.
-
-    Args:
-        signal: Raw signal dictionary.
-        source_tier: Source reliability tier.
-        category: Signal category.
-        severity_modifiers: Keyword modifier dictionaries.
-        reference_date: Reference date for recency scoring.
-
-    Returns:
-        Severity level string (critical/high/elevated/moderate/low).
-    """
+def _severity_text(signal: dict[str, Any]) -> str:
+    """Join the title, body, and summary fields scanned for severity."""
     parts: list[str] = []
 
     title = signal.get("title", "")
@@ -235,14 +232,33 @@ def classify_severity(
             parts.append(val.get("en", ""))
             parts.append(val.get("zh", ""))
 
-    combined = " ".join(parts)
-    signal_date = signal.get("date", "")
+    return " ".join(parts)
+
+
+def classify_severity(
+    signal: dict[str, Any],
+    source_tier: str,
+    category: str,
+    severity_modifiers: dict[str, Any] | None = None,
+    reference_date: date | None = None,
+) -> str:
+    """Classify a signal's severity level.
+
+    Args:
+        signal: Raw signal dictionary.
+        source_tier: Source reliability tier.
+        category: Signal category.
+        severity_modifiers: Keyword modifier dictionaries.
+        reference_date: Reference date for recency scoring.
 
+    Returns:
+        Severity level string (critical/high/elevated/moderate/low).
+    """
     score = compute_severity_score(
-        text=combined,
+        text=_severity_text(signal),
         source_tier=source_tier,
         category=category,
-        signal_date=signal_date,
+        signal_date=signal.get("date", ""),
         severity_modifiers=severity_modifiers,
         reference_date=reference_date,
     )
@@ -10,74 +10,165 @@ Provides commands:
 from __future__ import annotations
 
 import logging
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
 
 from analysis import __version__
-from analysis.active_situations import track_situations
-from analysis.classifiers.category import classify_signal, validate_category
-from analysis.classifiers.severity import classify_severity
-from analysis.classifiers.source_mapper import map_signal_source_tier
-from analysis.config import PROJECT_ROOT, load_config
-from analysis.data_transforms import (
-    determine_volume_number,
-    extract_market_signals,
-    generate_quote,
-    generate_todays_number,
-    load_supplementary_data,
-)
-from analysis.dedup import deduplicate_signals, load_recent_signals
-from analysis.entities import (
-    build_entity_directory,
-    match_entities_across_signals,
-    match_entities_in_signal,
-)
-from analysis.output import assemble_briefing, validate_briefing, write_archive, write_processed
-from analysis.signal_filtering import (
-    filter_and_prioritize_signals,
-    filter_low_value_signals,
-    is_china_relevant,
-    load_raw_signals,
-)
-from analysis.signal_normalization import (
-    is_primarily_chinese,
-    normalize_signal,
-    translate_signals_batch,
-)
-from analysis.tension_index import compute_tension_index
-from analysis.timeline_compiler import (
-    compile_canada_china_timeline,
-    mark_signal_as_milestone,
-    write_timeline,
-)
-from analysis.translate import fix_english_text
-from analysis.trend import compute_trends
-from analysis.volume_compiler import compile_volume, write_volume
+
+if TYPE_CHECKING:
+    from analysis.config import AppConfig
 
 logger = logging.getLogger("analysis")
 
+_CLASSIFY_WORKERS = int(os.environ.get("CC_CLASSIFY_WORKERS", "3"))
+
 
 def _setup_logging(level: str, fmt: str) -> None:
-    """Configure logging for the pipeline."""
+    """Configure logging for the pipeline (once per process)."""
+    if logging.getLogger().handlers:
+        return
     logging.basicConfig(
-        level=getattr(logging, level.upper(), logging.INFO),
+        level=logging.getLevelNamesMapping().get(level.upper(), logging.INFO),
         format=fmt,
         stream=sys.stderr,
     )
 
 
+@lru_cache(maxsize=4)
+def _load_config_cached(env: str) -> AppConfig:
+    """Load the config for a resolved env once per process.
+
+    Commands invoked repeatedly in one process (tests, embedding callers)
+    reuse the parsed YAML instead of re-reading every config file.
+    """
+    from analysis.config import load_config
+
+    return load_config(env=env)
+
+
+def _load_config(env: str | None) -> AppConfig:
+    """Resolve *env* (flag, then CC_ENV) and return its cached config."""
+    from analysis.config import detect_env
+
+    return _load_config_cached(detect_env(env))
+
+
+@lru_cache(maxsize=16)
 def _resolve_path(path_str: str) -> Path:
-    """Resolve a path relative to the project root."""
+    """Resolve a path relative to the project root.
+
+    Cached: commands resolve the same few config paths repeatedly and
+    ``Path.resolve()`` walks the filesystem for each component.
+    """
+    from analysis.config import PROJECT_ROOT
+
     p = Path(path_str)
     if p.is_absolute():
         return p
     return (PROJECT_ROOT / p).resolve()
 
 
+def _slugify(title: str) -> str:
+    """Build a signal id from a title: lowercased, spaces to dashes, 50 chars."""
+    # ASCII case mapping is one-to-one, so cut to length before transforming;
+    # other scripts can change length (or form, e.g. final sigma) on lower().
+    if title.isascii():
+        return title[:50].lower().replace(" ", "-")
+    return title.lower().replace(" ", "-")[:50]
+
+
+def _normalize_kwargs(config: AppConfig) -> dict[str, Any]:
+    """Resolve the config tables normalize_signal() needs, once per batch."""
+    templates = config.templates
+    sources = config.chinese_sources
+    return {
+        "impact_templates": templates.impact_templates or None,
+        "watch_templates": templates.watch_templates or None,
+        "canada_perspective": templates.canada_perspective or None,
+        "china_perspective": templates.china_perspective or None,
+        "source_names": sources.source_names or None,
+        "domains": sources.domains or None,
+        "name_translations": sources.name_translations or None,
+    }
+
+
+def _classify_signal(
+    signal: dict[str, Any],
+    index: int,
+    categories: dict[str, dict[str, list[str]]],
+    severity_modifiers: dict[str, Any],
+    normalize_kwargs: dict[str, Any],
+) -> dict[str, Any]:
+    """Classify, validate, and normalize a single deduplicated signal."""
+    from analysis.classifiers.combined import classify_all
+    from analysis.signal_normalization import normalize_signal
+
+    category, severity, _ = classify_all(
+        signal, categories, severity_modifiers=severity_modifiers,
+    )
+
+    # The loaded signals are owned by the pipeline (pre-classification
+    # already tags them in place), and normalize_signal returns its own
+    # copy, so annotate the signal directly rather than copying it twice.
+    signal["category"] = category
+    signal["severity"] = severity
+
+    if "id" not in signal:
+        title = signal.get("title", "")
+        if isinstance(title, dict):
+            title = title.get("en", "")
+        signal["id"] = _slugify(title) if title else f"signal-{index}"
+
+    return normalize_signal(signal, **normalize_kwargs)
+
+
+def _classify_signals(
+    signals: list[dict[str, Any]],
+    config: AppConfig,
+    max_workers: int = _CLASSIFY_WORKERS,
+) -> list[dict[str, Any]]:
+    """Classify and normalize signals concurrently.
+
+    Each input signal gets its ``category``, ``severity`` and ``id`` set in
+    place; the returned list holds the normalized copies. Callers must pass
+    dicts the pipeline owns (freshly loaded or already copied), not signals
+    they go on using elsewhere.
+
+    Normalization makes blocking LLM calls (summaries, perspectives), so
+    per-signal work is dominated by network wait. A thread pool overlaps
+    that latency; ``pool.map`` keeps results in input order.
+
+    Threads rather than processes: the keyword classifiers are cheap next
+    to the LLM round-trips, the batch is capped at ``max_signals``, and a
+    process pool would have to pickle ``config`` into every worker and
+    would lose the per-process keyword/regex caches.
+    """
+    # Config tables are resolved once here rather than per signal.
+    categories = config.keywords.categories
+    severity_modifiers = config.keywords.severity_modifiers
+    normalize_kwargs = _normalize_kwargs(config)
+
+    if max_workers <= 1 or len(signals) <= 1:
+        return [
+            _classify_signal(s, i, categories, severity_modifiers, normalize_kwargs)
+            for i, s in enumerate(signals)
+        ]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(
+            _classify_signal, signals, range(len(signals)),
+            repeat(categories), repeat(severity_modifiers), repeat(normalize_kwargs),
+        ))
+
+
 @click.group()
 @click.version_option(version=__version__)
 def main() -> None:
@@ -97,6 +188,8 @@ def main() -> None:
               help="Archive directory (default: ../cc-data/archive/)")
 @click.option("--schemas-dir", default=None,
               help="Schemas directory for validation")
+@click.option("--rescan-volumes", is_flag=True, default=False,
+              help="Scan every archived briefing for the highest volume number")
 def run(
     env: str | None,
     target_date: str | None,
@@ -104,9 +197,45 @@ def run(
     output_dir: str | None,
     archive_dir: str | None,
     schemas_dir: str | None,
+    rescan_volumes: bool,
 ) -> None:
     """Run the full analysis pipeline for a date."""
-    config = load_config(env=env)
+    # Pipeline modules are imported per command so that --help and the
+    # lighter commands don't pay for loading the whole analysis stack.
+    from analysis.active_situations import track_situations
+    from analysis.classifiers.category import classify_signal
+    from analysis.data_transforms import (
+        determine_volume_number,
+        extract_market_signals,
+        generate_quote,
+        generate_todays_number,
+        load_supplementary_data,
+    )
+    from analysis.dedup import deduplicate_signals, load_recent_signals
+    from analysis.entities import (
+        build_entity_directory,
+        match_entities_across_signals,
+        match_entities_in_signal,
+    )
+    from analysis.output import (
+        assemble_briefing,
+        encode_briefing,
+        validate_briefing,
+        write_archive,
+        write_processed,
+    )
+    from analysis.signal_filtering import (
+        filter_and_prioritize_signals,
+        filter_low_value_signals,
+        is_china_relevant,
+        load_raw_signals,
+    )
+    from analysis.signal_normalization import is_primarily_chinese, translate_signals_batch
+    from analysis.tension_index import compute_tension_index
+    from analysis.translate import fix_english_text
+    from analysis.trend import compute_trends
+
+    config = _load_config(env)
     _setup_logging(config.logging.level, config.logging.format)
 
     if target_date is None:
@@ -157,11 +286,13 @@ def run(
 
     # Pre-classify for dedup
     logger.info("Pre-classifying signals for dedup...")
+    categories_kw = config.keywords.categories
+    entity_aliases = config.keywords.entity_aliases
     for signal in raw_signals:
         if "category" not in signal:
-            signal["category"] = classify_signal(signal, config.keywords.categories)
+            signal["category"] = classify_signal(signal, categories_kw)
         if "entity_ids" not in signal:
-            signal["entity_ids"] = match_entities_in_signal(signal, config.keywords.entity_aliases)
+            signal["entity_ids"] = match_entities_in_signal(signal, entity_aliases)
 
     # Deduplicate
     logger.info("Deduplicating signals...")
@@ -181,66 +312,20 @@ def run(
         entity_body_jaccard_threshold=dt.entity_body_jaccard,
     )
 
-    # Load supplementary data
-    supplementary = load_supplementary_data(resolved_raw)
-
-    # Step 2: Classify signals
-    logger.info("Classifying signals...")
-    classified_signals: list[dict[str, Any]] = []
-
-    for signal in raw_signals:
-        category = classify_signal(signal, config.keywords.categories)
-        # Validate category with strong-indicator override rules
-        parts: list[str] = []
-        title_val = signal.get("title", "")
-        if isinstance(title_val, dict):
-            parts.extend([title_val.get("en", ""), title_val.get("zh", "")])
-        elif isinstance(title_val, str):
-            parts.append(title_val)
-        for bk in ("body", "body_text"):
-            bv = signal.get(bk, "")
-            if isinstance(bv, dict):
-                parts.extend([bv.get("en", ""), bv.get("zh", "")])
-            elif isinstance(bv, str) and bv:
-                parts.append(bv)
-                break
-        category = validate_category(" ".join(parts), category)
-        source_tier = map_signal_source_tier(signal)
-        severity = classify_severity(
-            signal,
-            source_tier=source_tier,
-            category=category,
-            severity_modifiers=config.keywords.severity_modifiers,
-            reference_date=None,
+    # Supplementary data and the volume number only read files, so they are
+    # loaded in the background while classification waits on the LLM.
+    with ThreadPoolExecutor(max_workers=2) as io_pool:
+        supplementary_future = io_pool.submit(load_supplementary_data, resolved_raw)
+        volume_future = io_pool.submit(
+            determine_volume_number, resolved_archive, rescan=rescan_volumes,
         )
 
-        classified = dict(signal)
-        classified["category"] = category
-        classified["severity"] = severity
-
-        if "id" not in classified:
-            title = signal.get("title", "")
-            if isinstance(title, dict):
-                title = title.get("en", "")
-            slug = (
-                title.lower().replace(" ", "-")[:50]
-                if title
-                else f"signal-{len(classified_signals)}"
-            )
-            classified["id"] = slug
-
-        classified = normalize_signal(
-            classified,
-            impact_templates=config.templates.impact_templates or None,
-            watch_templates=config.templates.watch_templates or None,
-            canada_perspective=config.templates.canada_perspective or None,
-            china_perspective=config.templates.china_perspective or None,
-            source_names=config.chinese_sources.source_names or None,
-            domains=config.chinese_sources.domains or None,
-            name_translations=config.chinese_sources.name_translations or None,
-        )
+        # Step 2: Classify signals
+        logger.info("Classifying signals...")
+        classified_signals = _classify_signals(raw_signals, config)
 
-        classified_signals.append(classified)
+    supplementary = supplementary_future.result()
+    volume_number = volume_future.result()
 
     logger.info("Classified %d signals", len(classified_signals))
 
@@ -257,12 +342,11 @@ def run(
     pre_count = len(classified_signals)
     quality_filtered = []
     for s in classified_signals:
-        body_en = s.get("body", {}).get("en", "")
+        body_en = s["body"]["en"]
         if not body_en or len(body_en.strip()) < 20:
-            title_preview = s.get("title", {}).get("en", "")[:50]
-            logger.debug("Dropping signal with empty body: %s", title_preview)
+            logger.debug("Dropping signal with empty body: %s", s["title"]["en"][:50])
             continue
-        title_en = s.get("title", {}).get("en", "")
+        title_en = s["title"]["en"]
         if is_primarily_chinese(title_en):
             logger.warning("Dropping signal with untranslated title: %s", title_en[:50])
             continue
@@ -305,11 +389,8 @@ def run(
 
     # Step 5: Match entities
     logger.info("Matching entities...")
-    entity_matches = match_entities_across_signals(
-        classified_signals,
-        config.keywords.entity_aliases,
-    )
-    entity_directory = build_entity_directory(entity_matches, config.keywords.entity_aliases)
+    entity_matches = match_entities_across_signals(classified_signals, entity_aliases)
+    entity_directory = build_entity_directory(entity_matches, entity_aliases)
     logger.info("Matched %d entities", len(entity_directory))
 
     # Step 6: Track active situations
@@ -321,7 +402,6 @@ def run(
     logger.info("Tracking %d active situations", len(situations))
 
     # Step 7: Supplementary content
-    volume_number = determine_volume_number(resolved_archive)
     todays_number = generate_todays_number(supplementary, classified_signals)
     quote = generate_quote(classified_signals)
 
@@ -363,17 +443,25 @@ def run(
 
     # Step 10: Write output
     logger.info("Writing output...")
-    processed_path = write_processed(target_date, briefing, resolved_output)
-    archive_path = write_archive(target_date, briefing, resolved_archive)
+    # Serialize once; the processed and archive copies are identical.
+    encoded = encode_briefing(briefing)
+    processed_path = write_processed(
+        target_date, briefing, resolved_output, encoded=encoded,
+    )
+    archive_path = write_archive(
+        target_date, briefing, resolved_archive, encoded=encoded,
+    )
 
     logger.info("Analysis complete.")
     logger.info("  Processed: %s", processed_path)
     logger.info("  Archive:   %s", archive_path)
 
-    click.echo(f"Analysis complete for {target_date} (volume {volume_number})")
-    click.echo(f"  Signals: {len(classified_signals)}")
-    click.echo(f"  Tension: {tension.composite:.1f} ({tension.level['en']})")
-    click.echo(f"  Output:  {processed_path}")
+    click.echo("\n".join((
+        f"Analysis complete for {target_date} (volume {volume_number})",
+        f"  Signals: {len(classified_signals)}",
+        f"  Tension: {tension.composite:.1f} ({tension.level['en']})",
+        f"  Output:  {processed_path}",
+    )))
 
 
 @main.command("compile-volume")
@@ -389,7 +477,9 @@ def compile_volume_cmd(
     archive_dir: str | None,
 ) -> None:
     """Compile monthly volume from daily briefings."""
-    config = load_config(env=env)
+    from analysis.volume_compiler import compile_volume, write_volume
+
+    config = _load_config(env)
     _setup_logging(config.logging.level, config.logging.format)
 
     if target_date is None:
@@ -402,10 +492,12 @@ def compile_volume_cmd(
     volume_meta = compile_volume(target_date, resolved_archive)
     output_path = write_volume(volume_meta, resolved_archive)
 
-    click.echo(f"Volume {volume_meta['volume_number']} compiled")
-    click.echo(f"  Period: {volume_meta['period_start']} to {volume_meta['period_end']}")
-    click.echo(f"  Signals: {volume_meta['signal_count']}")
-    click.echo(f"  Output: {output_path}")
+    click.echo("\n".join((
+        f"Volume {volume_meta['volume_number']} compiled",
+        f"  Period: {volume_meta['period_start']} to {volume_meta['period_end']}",
+        f"  Signals: {volume_meta['signal_count']}",
+        f"  Output: {output_path}",
+    )))
 
 
 @main.command("compile-timeline")
@@ -427,7 +519,9 @@ def compile_timeline_cmd(
     timelines_dir: str | None,
 ) -> None:
     """Compile Canada-China timeline from daily briefings."""
-    config = load_config(env=env)
+    from analysis.timeline_compiler import compile_canada_china_timeline, write_timeline
+
+    config = _load_config(env)
     _setup_logging(config.logging.level, config.logging.format)
 
     resolved_archive = archive_dir or str(_resolve_path(config.paths.archive_dir))
@@ -452,11 +546,13 @@ def compile_timeline_cmd(
 
     output_path = write_timeline(timeline, resolved_timelines)
 
-    click.echo("Timeline compiled successfully")
-    click.echo(f"  Events:    {timeline['metadata']['total_events']}")
-    click.echo(f"  Milestones: {timeline['metadata']['total_milestones']}")
-    click.echo(f"  Tension points: {len(timeline.get('tension_trend', []))}")
-    click.echo(f"  Output:    {output_path}")
+    click.echo("\n".join((
+        "Timeline compiled successfully",
+        f"  Events:    {timeline['metadata']['total_events']}",
+        f"  Milestones: {timeline['metadata']['total_milestones']}",
+        f"  Tension points: {len(timeline.get('tension_trend', []))}",
+        f"  Output:    {output_path}",
+    )))
 
 
 @main.command("mark-milestone")
@@ -478,7 +574,9 @@ def mark_milestone_cmd(
     env: str | None,
 ) -> None:
     """Mark a signal as a historical milestone."""
-    config = load_config(env=env)
+    from analysis.timeline_compiler import mark_signal_as_milestone
+
+    config = _load_config(env)
     _setup_logging(config.logging.level, config.logging.format)
 
     resolved_archive = archive_dir or str(_resolve_path(config.paths.archive_dir))
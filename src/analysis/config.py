@@ -16,8 +16,11 @@ import yaml
 VALID_ENVS = ("dev", "staging", "prod")
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
+# libyaml-backed loader when PyYAML was built with it; same safe subset.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class PathsConfig:
     """Filesystem paths for data I/O."""
 
@@ -27,7 +30,7 @@ class PathsConfig:
     schemas_dir: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TensionConfig:
     """Configuration for tension index computation."""
 
@@ -35,7 +38,7 @@ class TensionConfig:
     cap_denominator: int = 20
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     """Logging settings."""
 
@@ -43,7 +46,7 @@ class LoggingConfig:
     format: str = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidationConfig:
     """Schema validation settings."""
 
@@ -51,7 +54,7 @@ class ValidationConfig:
     schema_file: str = "briefing.schema.json"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KeywordDicts:
     """Loaded keyword dictionaries."""
 
@@ -63,7 +66,7 @@ class KeywordDicts:
 # --- Threshold dataclasses ---
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DedupThresholds:
     """Deduplication thresholds."""
 
@@ -75,7 +78,7 @@ class DedupThresholds:
     lookback_days: int = 7
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TextProcessingThresholds:
     """Text processing thresholds."""
 
@@ -83,7 +86,7 @@ class TextProcessingThresholds:
     min_sentence_len: int = 15
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FilteringThresholds:
     """Signal filtering thresholds."""
 
@@ -93,7 +96,7 @@ class FilteringThresholds:
     max_per_source: int = 3
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TranslationThresholds:
     """Translation quality thresholds."""
 
@@ -101,7 +104,7 @@ class TranslationThresholds:
     english_fragment_threshold: float = 0.15
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ThresholdsConfig:
     """All configurable thresholds."""
 
@@ -114,7 +117,7 @@ class ThresholdsConfig:
 # --- Template / data config dataclasses ---
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TemplateData:
     """Loaded implication and perspective templates."""
 
@@ -124,7 +127,7 @@ class TemplateData:
     china_perspective: dict[str, dict[str, str]] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChineseSourceData:
     """Chinese source detection data."""
 
@@ -133,7 +136,7 @@ class ChineseSourceData:
     name_translations: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RelevanceData:
     """Relevance and value-scoring keyword lists."""
 
@@ -146,7 +149,7 @@ class RelevanceData:
     regulatory_keywords: list[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TextPatternData:
     """Text processing pattern lists."""
 
@@ -155,7 +158,7 @@ class TextPatternData:
     boilerplate_patterns: list[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Top-level application configuration."""
 
@@ -186,20 +189,39 @@ def detect_env(cli_env: str | None = None) -> str:
     return env
 
 
+# Parsed YAML by path, tagged with the (mtime_ns, size) it was read at, so
+# repeated load_config() calls skip the pure-Python parse until a file changes.
+_YAML_CACHE: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
+def _read_yaml(path: Path, st: os.stat_result) -> dict[str, Any]:
+    """Parse *path*, reusing the cached result while its stat is unchanged."""
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER) or {}
+    _YAML_CACHE[path] = (stamp, data)
+    return data
+
+
 def _load_yaml(path: Path) -> dict[str, Any]:
     """Load a YAML file and return its contents as a dict."""
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
-    with open(path, encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {path}") from None
+    return _read_yaml(path, st)
 
 
 def _load_yaml_optional(path: Path) -> dict[str, Any]:
     """Load a YAML file, returning empty dict if missing."""
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return {}
-    with open(path, encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    return _read_yaml(path, st)
 
 
 def _load_keyword_dicts(config_dir: Path) -> KeywordDicts:
@@ -210,17 +232,9 @@ def _load_keyword_dicts(config_dir: Path) -> KeywordDicts:
     severity_path = kw_dir / "severity_modifiers.yaml"
     entity_path = kw_dir / "entity_aliases.yaml"
 
-    categories: dict[str, dict[str, list[str]]] = {}
-    if categories_path.exists():
-        categories = _load_yaml(categories_path)
-
-    severity_modifiers: dict[str, Any] = {}
-    if severity_path.exists():
-        severity_modifiers = _load_yaml(severity_path)
-
-    entity_aliases: dict[str, dict[str, list[str]]] = {}
-    if entity_path.exists():
-        entity_aliases = _load_yaml(entity_path)
+    categories: dict[str, dict[str, list[str]]] = _load_yaml_optional(categories_path)
+    severity_modifiers: dict[str, Any] = _load_yaml_optional(severity_path)
+    entity_aliases: dict[str, dict[str, list[str]]] = _load_yaml_optional(entity_path)
 
     return KeywordDicts(
         categories=categories,
@@ -321,6 +335,11 @@ def load_config(
 ) -> AppConfig:
     """Load and parse the YAML config for the given environment.
 
+    Not memoized itself: ``env=None`` depends on CC_ENV at call time and
+    edited files must be picked up. Repeated calls still skip YAML parsing
+    for unchanged files (see ``_YAML_CACHE``), and the CLI keeps one
+    AppConfig per resolved env.
+
     Args:
         env: The environment name (dev/staging/prod). Auto-detected if None.
         config_dir: Override the config directory path.
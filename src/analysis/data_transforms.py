@@ -9,15 +9,36 @@ Extracted from cli.py Groups F+G.
 
 from __future__ import annotations
 
+import heapq
 import json
 import logging
-from datetime import datetime
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from analysis import json_io
+from analysis.signal_filtering import _LOAD_WORKERS
+
 logger = logging.getLogger("analysis")
 
 
+def _sparkline_points(sparkline: list[float]) -> str:
+    """Map sparkline values onto a 100x32 SVG polyline ("x,y x,y ...")."""
+    if not sparkline or len(sparkline) < 2:
+        return ""
+    vals = list(map(float, sparkline))
+    mn, mx = min(vals), max(vals)
+    rng = mx - mn if mx != mn else 1
+    last = len(vals) - 1
+    return " ".join(
+        f"{i / last * 100:.0f},{32 - (v - mn) / rng * 30:.1f}"
+        for i, v in enumerate(vals)
+    )
+
+
 def transform_market_data(raw: dict[str, Any]) -> dict[str, Any]:
     """Transform raw yahoo_finance fetcher output to processed schema."""
     indices = []
@@ -26,25 +47,12 @@ def transform_market_data(raw: dict[str, Any]) -> dict[str, Any]:
         direction = "up" if change_pct >= 0 else "down"
         change_str = f"{change_pct:+.2f}%"
 
-        sparkline = idx.get("sparkline", [])
-        sparkline_points = ""
-        if sparkline and len(sparkline) >= 2:
-            vals = [float(v) for v in sparkline]
-            mn, mx = min(vals), max(vals)
-            rng = mx - mn if mx != mn else 1
-            pts = []
-            for i, v in enumerate(vals):
-                x = (i / (len(vals) - 1)) * 100
-                y = 32 - ((v - mn) / rng) * 30
-                pts.append(f"{x:.0f},{y:.1f}")
-            sparkline_points = " ".join(pts)
-
         indices.append({
             "name": {"en": idx.get("name", ""), "zh": idx.get("name", "")},
             "value": f"{idx.get('value', 0):,.2f}",
             "change": change_str,
             "direction": direction,
-            "sparkline_points": sparkline_points,
+            "sparkline_points": _sparkline_points(idx.get("sparkline", [])),
         })
 
     sectors = []
@@ -93,37 +101,52 @@ def transform_market_data(raw: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+_TREND_LABELS = {
+    "up": ("Increasing", "增长"),
+    "down": ("Decreasing", "下降"),
+    "stable": ("Stable", "稳定"),
+    "disrupted": ("Disrupted", "中断"),
+}
+
+
+def _bilingual_cad_amount(val: float) -> dict[str, str]:
+    """Format a CAD millions amount as a bilingual {"en", "zh"} table value.
+
+    Unlike ``_format_cad`` (the today's-number headline), the en side
+    carries a " CAD" suffix and negative amounts such as trade balances
+    switch to billions by magnitude.
+    """
+    if abs(val) >= 1000:
+        return {
+            "en": f"${val / 1000:.1f}B CAD",
+            "zh": f"{val / 1000:.1f}0亿加元",
+        }
+    return {
+        "en": f"${val:,.0f}M CAD",
+        "zh": f"{val:,.0f}百万加元",
+    }
+
+
 def transform_trade_data(raw: dict[str, Any]) -> dict[str, Any]:
     """Transform raw statcan fetcher output to processed schema."""
     imports_m = raw.get("imports_cad_millions", 0)
     exports_m = raw.get("exports_cad_millions", 0)
     balance_m = raw.get("balance_cad_millions", 0)
 
-    def _fmt_cad(val: float) -> dict[str, str]:
-        if abs(val) >= 1000:
-            return {
-                "en": f"${val / 1000:.1f}B CAD",
-                "zh": f"{val / 1000:.1f}0亿加元",
-            }
-        return {
-            "en": f"${val:,.0f}M CAD",
-            "zh": f"{val:,.0f}百万加元",
-        }
-
     balance_dir = "down" if balance_m < 0 else "up"
 
     summary_stats = [
         {
             "label": {"en": "Total Imports from China", "zh": "从中国进口总额"},
-            "value": _fmt_cad(imports_m),
+            "value": _bilingual_cad_amount(imports_m),
         },
         {
             "label": {"en": "Total Exports to China", "zh": "对中国出口总额"},
-            "value": _fmt_cad(exports_m),
+            "value": _bilingual_cad_amount(exports_m),
         },
         {
             "label": {"en": "Trade Balance", "zh": "贸易差额"},
-            "value": _fmt_cad(balance_m),
+            "value": _bilingual_cad_amount(balance_m),
             "direction": balance_dir,
         },
     ]
@@ -134,27 +157,23 @@ def transform_trade_data(raw: dict[str, Any]) -> dict[str, Any]:
         imp_m = c.get("import_cad_millions", 0) or 0
         bal_m = c.get("balance_cad_millions", exp_m - imp_m)
         trend_val = c.get("trend", "stable")
-        disrupted = trend_val.lower() == "disrupted" if isinstance(trend_val, str) else False
+        trend_key = trend_val.lower() if isinstance(trend_val, str) else "stable"
+        disrupted = trend_key == "disrupted"
 
-        trend_labels = {
-            "up": {"en": "Increasing", "zh": "增长"},
-            "down": {"en": "Decreasing", "zh": "下降"},
-            "stable": {"en": "Stable", "zh": "稳定"},
-            "disrupted": {"en": "Disrupted", "zh": "中断"},
-        }
-        trend_display = trend_labels.get(
-            trend_val.lower() if isinstance(trend_val, str) else "stable",
-            {"en": str(trend_val), "zh": str(trend_val)},
-        )
+        label = _TREND_LABELS.get(trend_key)
+        if label is not None:
+            trend_display = {"en": label[0], "zh": label[1]}
+        else:
+            trend_display = {"en": str(trend_val), "zh": str(trend_val)}
 
         commodity_table.append({
             "commodity": {
                 "en": c.get("name", c.get("name_en", "")),
                 "zh": c.get("name_zh", c.get("name", "")),
             },
-            "export": _fmt_cad(exp_m),
-            "import": _fmt_cad(imp_m),
-            "balance": _fmt_cad(bal_m),
+            "export": _bilingual_cad_amount(exp_m),
+            "import": _bilingual_cad_amount(imp_m),
+            "balance": _bilingual_cad_amount(bal_m),
             "balance_direction": "down" if bal_m < 0 else "up",
             "trend": trend_display,
             "disrupted": disrupted,
@@ -168,6 +187,14 @@ def transform_trade_data(raw: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+_BILL_STATUS_LABELS = {
+    "RoyalAssentGiven": ("Royal Assent", "御准"),
+    "HouseInCommittee": ("In Committee", "委员会审议中"),
+    "HouseAt2ndReading": ("2nd Reading", "二读"),
+    "SenateInCommittee": ("Senate Committee", "参议院委员会"),
+}
+
+
 def transform_parliament_data(raw: dict[str, Any]) -> dict[str, Any]:
     """Transform raw parliament fetcher output to processed schema."""
     bills = []
@@ -175,17 +202,11 @@ def transform_parliament_data(raw: dict[str, Any]) -> dict[str, Any]:
         title_en = b.get("title", "")
         title_zh = b.get("title_fr", title_en)
         status = b.get("status", "")
-        status_map = {
-            "RoyalAssentGiven": {"en": "Royal Assent", "zh": "御准"},
-            "HouseInCommittee": {"en": "In Committee", "zh": "委员会审议中"},
-            "HouseAt2ndReading": {"en": "2nd Reading", "zh": "二读"},
-            "SenateInCommittee": {"en": "Senate Committee", "zh": "参议院委员会"},
-        }
-        status_display = status_map.get(status, {"en": status, "zh": status})
+        en_status, zh_status = _BILL_STATUS_LABELS.get(status, (status, status))
         bills.append({
             "id": b.get("id", ""),
             "title": {"en": title_en, "zh": title_zh},
-            "status": status_display,
+            "status": {"en": en_status, "zh": zh_status},
             "relevance": {"en": "", "zh": ""},
             "last_action": {"en": "", "zh": ""},
         })
@@ -237,52 +258,152 @@ def load_supplementary_data(raw_dir: str) -> dict[str, Any]:
         "parliament.json": "parliament",
     }
 
+    # One directory listing instead of a failed open per absent file; only
+    # known names are kept, and is_file() uses the entry's cached type.
+    try:
+        with os.scandir(raw_path) as it:
+            present = {e.name for e in it if e.name in file_mapping and e.is_file()}
+    except OSError:
+        return result
+
+    # file_mapping order decides precedence (statcan before trade, ...).
     for filename, key in file_mapping.items():
-        if result[key] is not None:
+        if result[key] is not None or filename not in present:
             continue
         file_path = raw_path / filename
-        if not file_path.exists():
-            continue
         try:
-            with open(file_path, encoding="utf-8") as f:
-                data = json.load(f)
-            if isinstance(data, dict) and "data" in data:
-                payload = data["data"]
-            else:
-                payload = data
-            if isinstance(payload, dict) and "error" in payload:
-                logger.warning("Skipping %s (error: %s)", filename, payload["error"])
-                continue
-            if not isinstance(payload, dict):
-                logger.warning("Skipping %s (unexpected format)", filename)
-                continue
-            result[key] = transformers[key](payload)
-            logger.info("Loaded and transformed %s", filename)
-        except (json.JSONDecodeError, OSError) as exc:
+            data = json_io.loads(file_path.read_bytes())
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as exc:
             logger.warning("Failed to load %s: %s", file_path, exc)
+            continue
+        if isinstance(data, dict) and "data" in data:
+            payload = data["data"]
+        else:
+            payload = data
+        if isinstance(payload, dict) and "error" in payload:
+            logger.warning("Skipping %s (error: %s)", filename, payload["error"])
+            continue
+        if not isinstance(payload, dict):
+            logger.warning("Skipping %s (unexpected format)", filename)
+            continue
+        result[key] = transformers[key](payload)
+        logger.info("Loaded and transformed %s", filename)
 
     return result
 
 
-def determine_volume_number(archive_dir: str) -> int:
-    """Determine the volume number for today's briefing."""
-    archive_path = Path(archive_dir) / "daily"
-    if not archive_path.exists():
+# assemble_briefing writes "date" then "volume" first, so for briefings this
+# pipeline produced the volume can be read from the opening bytes. Any run of
+# scalar members may precede it; a nested object or array ahead of "volume"
+# fails the match, so a nested key of the same name is never picked up.
+_VOLUME_HEAD_RE = re.compile(
+    rb'\A\{(?:\s*"[^"\\]*":\s*(?:"[^"\\]*"|[-+.\w]+)\s*,)*?\s*"volume":\s*(\d+)\s*[,}]'
+)
+_VOLUME_HEAD_BYTES = 256
+
+
+def _read_volume(briefing_file: str) -> int | None:
+    """Return the volume stored in *briefing_file*, or None if unreadable."""
+    try:
+        with open(briefing_file, "rb") as f:
+            match = _VOLUME_HEAD_RE.match(f.read(_VOLUME_HEAD_BYTES))
+            if match:
+                return int(match.group(1))
+            f.seek(0)
+            data = json_io.loads(f.read())
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+        return None
+    vol = data.get("volume") if isinstance(data, dict) else None
+    return vol if isinstance(vol, int) else None
+
+
+def determine_volume_number(archive_dir: str, rescan: bool = False) -> int:
+    """Determine the volume number for today's briefing.
+
+    Volumes increase monotonically with date, so the newest archived
+    briefing already carries the maximum. Entries are walked newest-first
+    (ISO dates sort lexicographically) and the first readable volume wins.
+    Pass ``rescan=True`` to read every briefing when backfills may have
+    broken that ordering.
+
+    A normal run reads only the head of the newest briefing, so no volume
+    index is cached in the archive: a sidecar keyed on directory mtime
+    would be unreliable after git checkouts of the data repo and would
+    add a generated file to it.
+    """
+    # One scandir pass: DirEntry.is_dir() comes from the directory read, and
+    # a missing briefing.json surfaces as OSError on open rather than via
+    # separate exists()/is_dir() stat calls.
+    try:
+        with os.scandir(Path(archive_dir) / "daily") as it:
+            entries = sorted(it, key=lambda e: e.name, reverse=True)
+    except OSError:
         return 1
 
-    max_vol = 0
-    for day_dir in archive_path.iterdir():
-        briefing_file = day_dir / "briefing.json" if day_dir.is_dir() else day_dir
-        if briefing_file.exists() and briefing_file.suffix == ".json":
-            try:
-                with open(briefing_file, encoding="utf-8") as f:
-                    data = json.load(f)
-                vol = data.get("volume", 0)
-                max_vol = max(max_vol, vol)
-            except (json.JSONDecodeError, OSError):
-                continue
+    # Lazy, so a normal run only checks entries up to the first readable one.
+    briefing_files = (f for e in entries if (f := _briefing_path(e)) is not None)
+
+    if rescan:
+        # Every briefing is read here, so overlap the file opens.
+        files = list(briefing_files)
+        if _LOAD_WORKERS <= 1 or len(files) <= 1:
+            read = [_read_volume(f) for f in files]
+        else:
+            with ThreadPoolExecutor(max_workers=min(_LOAD_WORKERS, len(files))) as pool:
+                read = list(pool.map(_read_volume, files))
+        return max((v for v in read if v is not None), default=0) + 1
+
+    for briefing_file in briefing_files:
+        vol = _read_volume(briefing_file)
+        if vol is not None:
+            return vol + 1
+    return 1
+
+
+# daily/ holds YYYY-MM-DD/ directories or flat YYYY-MM-DD.json files.
+_DAILY_ENTRY_RE = re.compile(r"\d{4}-\d{2}-\d{2}(\.json)?")
+
+
+def _briefing_path(entry: os.DirEntry[str]) -> str | None:
+    """Return the briefing file for a dated daily/ entry (dir or flat .json).
+
+    Undated names are skipped: they sort after digits, so a stray
+    ``latest/`` or ``index.json`` would otherwise be read as the newest.
+    """
+    match = _DAILY_ENTRY_RE.fullmatch(entry.name)
+    if match is None:
+        return None
+    if match.group(1):
+        return entry.path
+    if entry.is_dir():
+        return os.path.join(entry.path, "briefing.json")
+    return None
+
+
+def _format_cad(val: float) -> tuple[str, str]:
+    """Format a CAD-millions amount as (en, zh) display strings."""
+    if val >= 1000:
+        return f"${val / 1000:.1f}B", f"{val / 1000:.1f}0亿加元"
+    return f"${val:,.0f}M", f"{val:,.0f}百万加元"
+
+
+# English month names, fixed rather than locale-dependent like strftime("%B").
+_MONTH_NAMES_EN = (
+    "", "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
 
-    return max_vol + 1
+def _reference_month(ref_period: Any) -> tuple[int, int] | None:
+    """Return (year, month) from a ``YYYY-MM...`` period, or None if malformed."""
+    if not isinstance(ref_period, str) or len(ref_period) < 7:
+        return None
+    year, sep, month = ref_period[:4], ref_period[4:5], ref_period[5:7]
+    if sep != "-" or not (year.isdecimal() and month.isdecimal()) or len(month) != 2:
+        return None
+    if not 1 <= int(month) <= 12:
+        return None
+    return int(year), int(month)
 
 
 def generate_todays_number(
@@ -298,29 +419,18 @@ def generate_todays_number(
         if imports_val and exports_val:
             total = imports_val + exports_val
 
-            def _fmt(val: float) -> tuple[str, str]:
-                if val >= 1000:
-                    return f"${val / 1000:.1f}B", f"{val / 1000:.1f}0亿加元"
-                return f"${val:,.0f}M", f"{val:,.0f}百万加元"
-
-            total_en, total_zh = _fmt(total)
-            imports_en, imports_zh = _fmt(imports_val)
-            exports_en, exports_zh = _fmt(exports_val)
+            total_en, total_zh = _format_cad(total)
+            imports_en, imports_zh = _format_cad(imports_val)
+            exports_en, exports_zh = _format_cad(exports_val)
 
             ref_period = trade.get("reference_period", "")
             period_en = ref_period
             period_zh = ref_period
-            if ref_period and len(ref_period) >= 7:
-                try:
-                    dt = datetime.strptime(ref_period[:7], "%Y-%m")
-                    period_en = dt.strftime("%B %Y")
-                    month_names_zh = [
-                        "", "1月", "2月", "3月", "4月", "5月", "6月",
-                        "7月", "8月", "9月", "10月", "11月", "12月",
-                    ]
-                    period_zh = f"{dt.year}年{month_names_zh[dt.month]}"
-                except ValueError:
-                    pass
+            parsed = _reference_month(ref_period)
+            if parsed:
+                year, month = parsed
+                period_en = f"{_MONTH_NAMES_EN[month]} {year}"
+                period_zh = f"{year}年{month}月"
 
             return {
                 "value": {"en": total_en, "zh": total_zh},
@@ -349,21 +459,43 @@ _REGULATORY_KEYWORDS = [
     "investigation", "license", "approval",
 ]
 
+# Plain substring alternations (no word boundaries), matched case-insensitively
+# on ASCII only so behaviour equals the old ``kw in title.lower()`` checks.
+_QUOTE_CHINA_RE = re.compile(r"china|chinese|beijing|xi |xi's", re.IGNORECASE | re.ASCII)
+_QUOTE_CANADA_RE = re.compile(r"canada|canadian|ottawa", re.IGNORECASE | re.ASCII)
+_SEVERITY_RANK = {"critical": 0, "high": 1, "elevated": 2, "moderate": 3, "low": 4}
+_MARKET_CATEGORIES = frozenset({"trade", "economic", "technology"})
+_SOURCE_RANK = {"Global Affairs Canada": 0, "Parliament of Canada": 1, "Xinhua": 2}
+
+
+@lru_cache(maxsize=8)
+def _encode_keywords(keywords: tuple[str, ...]) -> tuple[bytes, ...] | None:
+    """Return ASCII byte forms of *keywords*, or None if any is non-ASCII."""
+    if not all(kw.isascii() for kw in keywords):
+        return None
+    return tuple(kw.encode("ascii") for kw in keywords)
+
 
 def is_regulatory(
     signal: dict[str, Any],
     regulatory_keywords: list[str] | None = None,
 ) -> bool:
-    """Check if a signal is about regulatory matters."""
+    """Check if a signal is about regulatory matters.
+
+    Expects a signal normalized by ``normalize_signal`` (bilingual title/body).
+    """
     keywords = regulatory_keywords if regulatory_keywords is not None else _REGULATORY_KEYWORDS
-    title = signal.get("title", "")
-    body = signal.get("body", "")
-    if isinstance(title, dict):
-        title = title.get("en", "")
-    if isinstance(body, dict):
-        body = body.get("en", "")
-    text = f"{title} {body}".lower()
-    return any(kw in text for kw in keywords)
+    text = f"{signal['title']['en']} {signal['body']['en']}"
+    encoded = _encode_keywords(tuple(keywords))
+    if encoded is None:
+        text = text.lower()
+        return any(kw in text for kw in keywords)
+    # ASCII-only keywords: lower-case a byte projection of the text instead
+    # of running Unicode case mapping over (often Chinese) body text.
+    # "replace" keeps one placeholder per dropped character so removing
+    # non-ASCII runs can never splice two words into a false match.
+    data = text.encode("ascii", "replace").lower()
+    return any(kw in data for kw in encoded)
 
 
 def extract_market_signals(
@@ -371,80 +503,73 @@ def extract_market_signals(
     max_count: int = 5,
     regulatory_keywords: list[str] | None = None,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    """Extract market signals and regulatory signals from classified signals."""
-    severity_rank = {"critical": 0, "high": 1, "elevated": 2, "moderate": 3, "low": 4}
-    market_categories = {"trade", "economic", "technology"}
+    """Extract market signals and regulatory signals from normalized signals."""
+    rank = _SEVERITY_RANK.get
 
     market = []
     regulatory = []
 
     for s in signals:
-        cat = s.get("category", "")
-        if cat in market_categories:
+        if s.get("category", "") in _MARKET_CATEGORIES:
             market.append(s)
         if is_regulatory(s, regulatory_keywords):
             regulatory.append(s)
 
-    market.sort(key=lambda s: severity_rank.get(s.get("severity", "low"), 4))
-    regulatory.sort(key=lambda s: severity_rank.get(s.get("severity", "low"), 4))
+    def by_severity(s: dict[str, Any]) -> int:
+        return rank(s.get("severity", "low"), 4)
+
+    # nsmallest is documented as equal to sorted(...)[:n], ties included,
+    # but only keeps max_count items instead of sorting every signal.
+    return (
+        heapq.nsmallest(max_count, market, key=by_severity),
+        heapq.nsmallest(max_count, regulatory, key=by_severity),
+    )
+
 
-    return market[:max_count], regulatory[:max_count]
+def _quote_score(s: dict[str, Any]) -> int:
+    """Rank a normalized signal as a quote candidate (lower is better).
+
+    Ranks are packed into one int (4 bits each, most significant first):
+    China/Canada relevance of the title, severity, whether the signal is
+    dated, then source preference.
+    """
+    title = s["title"]["en"]
+    china_in_title = _QUOTE_CHINA_RE.search(title) is not None
+    if china_in_title and _QUOTE_CANADA_RE.search(title) is not None:
+        relevance = 0
+    elif china_in_title:
+        relevance = 1
+    else:
+        relevance = 2
+
+    sev = _SEVERITY_RANK.get(s.get("severity", "low"), 4)
+    src = _SOURCE_RANK.get(s["source"]["en"], 3)
+    has_date = 0 if s.get("date") else 1
+    return relevance << 12 | sev << 8 | has_date << 4 | src
 
 
 def generate_quote(signals: list[dict[str, Any]]) -> dict[str, Any]:
-    """Pick the best signal's title as the quote."""
-    severity_rank = {"critical": 0, "high": 1, "elevated": 2, "moderate": 3, "low": 4}
-    source_rank = {"Global Affairs Canada": 0, "Parliament of Canada": 1, "Xinhua": 2}
+    """Pick the best signal's title as the quote.
 
+    Expects signals normalized by ``normalize_signal`` (bilingual title/source).
+    Ties keep the earliest signal, so the scan can stop at the first one
+    reaching the best possible score (0: bilateral, critical, dated, from
+    Global Affairs Canada).
+    """
     best = None
-    best_score = (9, 9, 9, 9)
-
+    best_score = 1 << 16
     for s in signals:
-        title = s.get("title", "")
-        if isinstance(title, dict):
-            title = title.get("en", "")
-        title_lower = title.lower()
-        china_in_title = any(
-            kw in title_lower
-            for kw in ["china", "chinese", "beijing", "xi ", "xi's"]
-        )
-        bilateral_in_title = china_in_title and any(
-            kw in title_lower for kw in ["canada", "canadian", "ottawa"]
-        )
-        if bilateral_in_title:
-            relevance = 0
-        elif china_in_title:
-            relevance = 1
-        else:
-            relevance = 2
-
-        sev = severity_rank.get(s.get("severity", "low"), 4)
-        src_name = s.get("source", "")
-        if isinstance(src_name, dict):
-            src_name = src_name.get("en", "")
-        src = source_rank.get(src_name, 3)
-        has_date = 0 if s.get("date") else 1
-        score = (relevance, sev, has_date, src)
+        score = _quote_score(s)
         if score < best_score:
-            best_score = score
-            best = s
+            best, best_score = s, score
+            if not score:
+                break
 
     if best:
-        title = best.get("title", {})
-        if isinstance(title, dict):
-            en_title = title.get("en", "")
-            zh_title = title.get("zh", en_title)
-        else:
-            en_title = str(title)
-            zh_title = en_title
-
-        source = best.get("source", {})
-        if isinstance(source, dict):
-            en_source = source.get("en", "")
-            zh_source = source.get("zh", en_source)
-        else:
-            en_source = str(source)
-            zh_source = en_source
+        en_title = best["title"]["en"]
+        zh_title = best["title"]["zh"]
+        en_source = best["source"]["en"]
+        zh_source = best["source"]["zh"]
 
         date_str = best.get("date", "")
 
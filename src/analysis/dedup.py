@@ -440,19 +440,20 @@ def load_recent_signals(
         ]
 
         for path in paths_to_try:
-            if path.exists():
-                try:
-                    with open(path, encoding="utf-8") as f:
-                        briefing = json.load(f)
-                    signals = briefing.get("signals", [])
-                    all_signals.extend(signals)
-                    logger.info(
-                        "Dedup: loaded %d signals from %s (%s)",
-                        len(signals), prev_date, path,
-                    )
-                    break  # Found this date, move to next offset
-                except (json.JSONDecodeError, OSError) as exc:
-                    logger.warning("Dedup: failed to load %s: %s", path, exc)
+            try:
+                briefing = json.loads(path.read_bytes())
+            except FileNotFoundError:
+                continue
+            except (json.JSONDecodeError, UnicodeDecodeError, OSError) as exc:
+                logger.warning("Dedup: failed to load %s: %s", path, exc)
+                continue
+            signals = briefing.get("signals", [])
+            all_signals.extend(signals)
+            logger.info(
+                "Dedup: loaded %d signals from %s (%s)",
+                len(signals), prev_date, path,
+            )
+            break  # Found this date, move to next offset
 
     logger.info(
         "Dedup: %d total previous signals from last %d day(s)",
@@ -507,12 +508,14 @@ def deduplicate_signals(
         for existing in kept:
             is_dup, reason = is_duplicate(signal, existing, **_dedup_kw)
             if is_dup:
-                title, _, _ = _extract_comparable_text(signal)
-                ex_title, _, _ = _extract_comparable_text(existing)
-                logger.debug(
-                    "Dedup (same-day, %s): dropped '%s' (matches '%s')",
-                    reason, title[:80], ex_title[:80],
-                )
+                # Titles are extracted only for this message; skip when muted.
+                if logger.isEnabledFor(logging.DEBUG):
+                    title, _, _ = _extract_comparable_text(signal)
+                    ex_title, _, _ = _extract_comparable_text(existing)
+                    logger.debug(
+                        "Dedup (same-day, %s): dropped '%s' (matches '%s')",
+                        reason, title[:80], ex_title[:80],
+                    )
                 if reason == "url":
                     stats.dropped_url += 1
                 elif reason == "title":
@@ -536,13 +539,14 @@ def deduplicate_signals(
             for prev in previous_signals:
                 is_dup, reason = is_duplicate(signal, prev, **_dedup_kw)
                 if is_dup:
-                    title, _, _ = _extract_comparable_text(signal)
-                    prev_title, _, _ = _extract_comparable_text(prev)
-                    logger.debug(
-                        "Dedup (cross-day, %s): dropped '%s' "
-                        "(matches previous '%s')",
-                        reason, title[:80], prev_title[:80],
-                    )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        title, _, _ = _extract_comparable_text(signal)
+                        prev_title, _, _ = _extract_comparable_text(prev)
+                        logger.debug(
+                            "Dedup (cross-day, %s): dropped '%s' "
+                            "(matches previous '%s')",
+                            reason, title[:80], prev_title[:80],
+                        )
                     if reason == "url":
                         stats.dropped_url += 1
                     elif reason == "title":
@@ -10,6 +10,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+from analysis.memo import identity_memo
+
 
 @dataclass
 class EntityMatch:
@@ -48,6 +50,24 @@ def _extract_text(signal: dict[str, Any]) -> str:
     return " ".join(parts)
 
 
+@identity_memo
+def _alias_table(
+    entity_aliases: dict[str, dict[str, list[str]]],
+) -> list[tuple[str, tuple[str, ...], tuple[str, ...]]]:
+    """Return (entity_id, lowered en aliases, zh aliases) rows for matching.
+
+    Built once per entity_aliases dict.
+    """
+    return [
+        (
+            entity_id,
+            tuple(alias.lower() for alias in lang_aliases.get("en", [])),
+            tuple(lang_aliases.get("zh", [])),
+        )
+        for entity_id, lang_aliases in entity_aliases.items()
+    ]
+
+
 def match_entities_in_signal(
     signal: dict[str, Any],
     entity_aliases: dict[str, dict[str, list[str]]],
@@ -65,20 +85,11 @@ def match_entities_in_signal(
     text_lower = text.lower()
     matched: set[str] = set()
 
-    for entity_id, lang_aliases in entity_aliases.items():
-        en_aliases = lang_aliases.get("en", [])
-        zh_aliases = lang_aliases.get("zh", [])
-
-        for alias in en_aliases:
-            if alias.lower() in text_lower:
-                matched.add(entity_id)
-                break
-
-        if entity_id not in matched:
-            for alias in zh_aliases:
-                if alias in text:
-                    matched.add(entity_id)
-                    break
+    for entity_id, en_aliases, zh_aliases in _alias_table(entity_aliases):
+        if any(alias in text_lower for alias in en_aliases) or any(
+            alias in text for alias in zh_aliases
+        ):
+            matched.add(entity_id)
 
     return sorted(matched)
 
@@ -0,0 +1,34 @@
+"""JSON decoding for the raw and archive loaders.
+
+Uses orjson when it is installed (``pip install cc-analysis[fast]``) and
+falls back to the stdlib ``json`` module otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(raw: bytes) -> Any:
+    """Decode a JSON document from raw file bytes.
+
+    orjson is stricter than the stdlib (no NaN/Infinity, 64-bit integer
+    limit), so documents it rejects are retried with ``json.loads`` and
+    only that error propagates.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+        UnicodeDecodeError: If the bytes are not valid UTF-8/16/32.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
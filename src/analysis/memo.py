@@ -0,0 +1,39 @@
+"""Memoization keyed on object identity, for unhashable config tables."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import wraps
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Distinct tables seen per process are few (one per config load); the cap
+# only bounds growth when callers keep building fresh tables, e.g. in tests.
+_MAX_ENTRIES = 8
+
+
+def identity_memo(build: Callable[[T], R]) -> Callable[[T], R]:
+    """Cache ``build(obj)`` per object identity.
+
+    For dicts and lists loaded from config, which cannot key an
+    ``lru_cache``. Each entry holds a reference to its object so the
+    ``id()`` cannot be reused by another object while cached; the cache
+    is cleared once it reaches ``_MAX_ENTRIES`` objects. Callers must not
+    mutate a table after it has been used.
+    """
+    cache: dict[int, tuple[Any, R]] = {}
+
+    @wraps(build)
+    def wrapper(obj: T) -> R:
+        entry = cache.get(id(obj))
+        if entry is None or entry[0] is not obj:
+            if len(cache) >= _MAX_ENTRIES:
+                cache.clear()
+            entry = (obj, build(obj))
+            cache[id(obj)] = entry
+        return entry[1]
+
+    wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+    return wrapper
@@ -8,6 +8,8 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -74,6 +76,58 @@ def assemble_briefing(
     return briefing
 
 
+_BRIEFING_SCHEMA = "briefing.schema.json"
+
+
+def _schema_stamps(schemas_dir: str) -> tuple[tuple[str, int], ...]:
+    """Return sorted (name, mtime_ns) pairs for every *.schema.json file."""
+    with os.scandir(schemas_dir) as it:
+        return tuple(sorted(
+            (e.name, e.stat().st_mtime_ns)
+            for e in it
+            if e.name.endswith(".schema.json") and e.is_file()
+        ))
+
+
+@lru_cache(maxsize=4)
+def _briefing_validator(
+    schemas_dir: str,
+    schema_stamps: tuple[tuple[str, int], ...],
+) -> Any:
+    """Build a jsonschema validator for the briefing schema in *schemas_dir*.
+
+    Cached per directory and the (name, mtime) of every schema in it, so
+    the store is parsed and the briefing schema checked against its
+    metaschema once per process, and editing any referenced schema
+    builds a fresh validator.
+
+    Raises:
+        ImportError: If jsonschema is not installed.
+    """
+    from jsonschema import RefResolver
+    from jsonschema.validators import validator_for
+
+    schemas_path = Path(schemas_dir)
+
+    # Build a local store keyed by each schema's $id so $ref resolution
+    # stays local instead of fetching from remote URLs. The briefing
+    # schema itself is in the stamps, so it is parsed only once.
+    store: dict[str, Any] = {}
+    for name, _ in schema_stamps:
+        s = json.loads((schemas_path / name).read_bytes())
+        sid = s.get("$id", name)
+        store[sid] = s
+        store[name] = s
+    schema = store[_BRIEFING_SCHEMA]
+
+    schema_uri = "file:///" + str(schemas_path.resolve()).replace("\\", "/") + "/"
+    resolver = RefResolver(schema_uri, schema, store=store)
+
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema, resolver=resolver)
+
+
 def validate_briefing(
     briefing: dict[str, Any],
     schemas_dir: str = "",
@@ -91,33 +145,24 @@ def validate_briefing(
         logger.warning("No schemas directory provided; skipping validation.")
         return True
 
-    schemas_path = Path(schemas_dir)
-    schema_file = schemas_path / "briefing.schema.json"
-
-    if not schema_file.exists():
+    try:
+        schema_stamps = _schema_stamps(schemas_dir)
+    except FileNotFoundError:
+        schema_stamps = ()
+    if not any(name == _BRIEFING_SCHEMA for name, _ in schema_stamps):
+        schema_file = Path(schemas_dir) / _BRIEFING_SCHEMA
         logger.warning("Schema file not found: %s; skipping validation.", schema_file)
         return True
 
     try:
-        from jsonschema import RefResolver, ValidationError, validate
-
-        with open(schema_file, encoding="utf-8") as f:
-            schema = json.load(f)
-
-        # Build a local store keyed by each schema's $id so $ref resolution
-        # stays local instead of fetching from remote URLs.
-        store: dict[str, Any] = {}
-        for sf in schemas_path.glob("*.schema.json"):
-            with open(sf, encoding="utf-8") as f:
-                s = json.load(f)
-            sid = s.get("$id", sf.name)
-            store[sid] = s
-            store[sf.name] = s
-
-        schema_uri = "file:///" + str(schemas_path.resolve()).replace("\\", "/") + "/"
-        resolver = RefResolver(schema_uri, schema, store=store)
-
-        validate(instance=briefing, schema=schema, resolver=resolver)
+        from jsonschema import ValidationError
+        from jsonschema.exceptions import best_match
+
+        validator = _briefing_validator(schemas_dir, schema_stamps)
+        # Same error selection as jsonschema.validate().
+        error = best_match(validator.iter_errors(briefing))
+        if error is not None:
+            raise error
         logger.info("Briefing validation passed.")
         return True
 
@@ -135,10 +180,20 @@ def validate_briefing(
         return False
 
 
+def encode_briefing(briefing: dict[str, Any]) -> bytes:
+    """Serialize a briefing as indented UTF-8 JSON in a single buffer.
+
+    ``json.dump`` streams many small chunks into the file object; building
+    the document once and writing it in one call avoids that overhead.
+    """
+    return json.dumps(briefing, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 def write_processed(
     date: str,
     briefing: dict[str, Any],
     output_dir: str,
+    encoded: bytes | None = None,
 ) -> Path:
     """Write briefing.json to the processed output directory.
 
@@ -148,6 +203,7 @@ def write_processed(
         date: Date string (YYYY-MM-DD).
         briefing: Complete briefing dict.
         output_dir: Base output directory.
+        encoded: ``encode_briefing(briefing)``, if the caller already has it.
 
     Returns:
         Path to the written file.
@@ -155,9 +211,11 @@ def write_processed(
     out_path = Path(output_dir) / date
     out_path.mkdir(parents=True, exist_ok=True)
 
+    # Serialize once; the dated file and the 'latest' copy share the bytes.
+    data = encoded if encoded is not None else encode_briefing(briefing)
+
     file_path = out_path / "briefing.json"
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(briefing, f, ensure_ascii=False, indent=2)
+    file_path.write_bytes(data)
 
     logger.info("Wrote processed briefing to %s", file_path)
 
@@ -165,8 +223,7 @@ def write_processed(
     latest_path = Path(output_dir) / "latest"
     latest_path.mkdir(parents=True, exist_ok=True)
     latest_file = latest_path / "briefing.json"
-    with open(latest_file, "w", encoding="utf-8") as f:
-        json.dump(briefing, f, ensure_ascii=False, indent=2)
+    latest_file.write_bytes(data)
 
     return file_path
 
@@ -175,6 +232,7 @@ def write_archive(
     date: str,
     briefing: dict[str, Any],
     archive_dir: str,
+    encoded: bytes | None = None,
 ) -> Path:
     """Write briefing.json to the archive directory.
 
@@ -184,6 +242,7 @@ def write_archive(
         date: Date string (YYYY-MM-DD).
         briefing: Complete briefing dict.
         archive_dir: Base archive directory.
+        encoded: ``encode_briefing(briefing)``, if the caller already has it.
 
     Returns:
         Path to the written file.
@@ -192,8 +251,7 @@ def write_archive(
     out_path.mkdir(parents=True, exist_ok=True)
 
     file_path = out_path / "briefing.json"
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(briefing, f, ensure_ascii=False, indent=2)
+    file_path.write_bytes(encoded if encoded is not None else encode_briefing(briefing))
 
     logger.info("Wrote archive briefing to %s", file_path)
     return file_path
@@ -9,14 +9,24 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import re
+from bisect import bisect_left
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
+from analysis import json_io
+
 logger = logging.getLogger("analysis")
 
+_LOAD_WORKERS = int(os.environ.get("CC_LOAD_WORKERS", "4"))
+
 # Default keyword lists — overridable via config params
 
 _CHINA_RELEVANCE_KEYWORDS = [
@@ -257,67 +267,133 @@ _CANADIAN_SOURCES: set[str] = {
     "canadian press", "toronto star",
 }
 
+_ISO_DATE_PREFIX_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
+
+_JSON_CONTAINER_STARTS = (b"{", b"[")
+# Fetcher payload keys that may hold the signal list, in precedence order.
+_PAYLOAD_LIST_KEYS = ("signals", "articles", "items", "results")
+
+
+@lru_cache(maxsize=16)
+def _keyword_re(keywords: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile literal *keywords* into one alternation, or None when empty."""
+    if not keywords:
+        return None
+    return re.compile("|".join(re.escape(kw) for kw in keywords))
+
 
-def load_raw_signals(raw_dir: str) -> list[dict[str, Any]]:
-    """Load raw signal data from the raw directory."""
+def _load_signal_file(json_file: Path) -> list[dict[str, Any]]:
+    """Parse one raw JSON file and return just its signal records.
+
+    Only the extracted records outlive this call; the envelope and any
+    other payload keys are released as soon as the file is processed.
+    Unreadable files are logged and yield no signals.
+    """
+    try:
+        raw = json_file.read_bytes()
+    except OSError as exc:
+        logger.warning("Failed to load %s: %s", json_file, exc)
+        return []
+    # Empty artifacts and non-JSON junk are common in the raw dir; reject
+    # them by their first byte instead of raising a JSONDecodeError each time.
+    if raw.lstrip()[:1] not in _JSON_CONTAINER_STARTS:
+        logger.warning("Failed to load %s: not a JSON object or array", json_file)
+        return []
+    try:
+        data = json_io.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+        logger.warning("Failed to load %s: %s", json_file, exc)
+        return []
+
+    if isinstance(data, dict) and "data" in data:
+        payload = data["data"]
+    else:
+        payload = data
+
+    if isinstance(payload, list):
+        return payload
+    if isinstance(payload, dict):
+        for key in _PAYLOAD_LIST_KEYS:
+            records = payload.get(key)
+            if isinstance(records, list):
+                return records
+        if "title" in payload or "headline" in payload:
+            return [payload]
+    return []
+
+
+def load_raw_signals(
+    raw_dir: str,
+    max_workers: int = _LOAD_WORKERS,
+) -> list[dict[str, Any]]:
+    """Load raw signal data from the raw directory.
+
+    Files are read and parsed on a thread pool; results are merged in
+    sorted filename order so the signal order is deterministic.
+    """
     raw_path = Path(raw_dir)
     signals: list[dict[str, Any]] = []
 
-    if not raw_path.exists():
+    # One scandir pass: is_file() uses the directory entry's type, so
+    # neither the existence check nor the filter costs extra stat calls.
+    try:
+        with os.scandir(raw_path) as it:
+            json_files = sorted(
+                Path(e.path) for e in it if e.name.endswith(".json") and e.is_file()
+            )
+    except FileNotFoundError:
         logger.warning("Raw directory not found: %s", raw_path)
         return signals
 
-    for json_file in sorted(raw_path.glob("*.json")):
-        try:
-            with open(json_file, encoding="utf-8") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, OSError) as exc:
-            logger.warning("Failed to load %s: %s", json_file, exc)
-            continue
-
-        if isinstance(data, dict) and "data" in data:
-            payload = data["data"]
-        else:
-            payload = data
-
-        if isinstance(payload, list):
-            signals.extend(payload)
-        elif isinstance(payload, dict):
-            for key in ("signals", "articles", "items", "results"):
-                if key in payload and isinstance(payload[key], list):
-                    signals.extend(payload[key])
-                    break
-            else:
-                if "title" in payload or "headline" in payload:
-                    signals.append(payload)
+    if max_workers <= 1 or len(json_files) <= 1:
+        for json_file in json_files:
+            signals.extend(_load_signal_file(json_file))
+        return signals
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(json_files))) as pool:
+        for file_signals in pool.map(_load_signal_file, json_files):
+            signals.extend(file_signals)
 
     return signals
 
 
 def parse_signal_date(signal: dict[str, Any]) -> datetime | None:
-    """Try to parse a date from a signal using common formats."""
-    raw_date = signal.get("date", "")
+    """Try to parse a date from a signal using common formats.
+
+    The result (including None) is cached on the signal under
+    ``_parsed_date`` so later pipeline stages don't parse it again.
+    """
+    if "_parsed_date" in signal:
+        return signal["_parsed_date"]
+    parsed = _parse_date(signal.get("date", ""))
+    signal["_parsed_date"] = parsed
+    return parsed
+
+
+def _parse_date(raw_date: str | dict[str, str]) -> datetime | None:
+    """Parse an ISO 8601 or RFC 822 date string (or bilingual dict)."""
     if isinstance(raw_date, dict):
         raw_date = raw_date.get("en", "")
     if not raw_date:
         return None
 
-    for fmt in (
-        "%Y-%m-%d",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%S%z",
-        "%a, %d %b %Y %H:%M:%S %z",
-        "%a, %d %b %Y %H:%M:%S %Z",
-    ):
-        try:
-            return datetime.strptime(raw_date[:len(raw_date)], fmt).replace(tzinfo=None)
-        except ValueError:
-            continue
+    # ISO 8601 (date, datetime, offset, "Z") via the C parser first, then
+    # RFC 822 as found in RSS feeds. Offsets are dropped, not converted.
+    try:
+        return datetime.fromisoformat(raw_date).replace(tzinfo=None)
+    except ValueError:
+        pass
 
-    m = re.match(r"(\d{4}-\d{2}-\d{2})", raw_date)
+    try:
+        return parsedate_to_datetime(raw_date).replace(tzinfo=None)
+    except (TypeError, ValueError):
+        pass
+
+    m = _ISO_DATE_PREFIX_RE.match(raw_date)
     if m:
         try:
-            return datetime.strptime(m.group(1), "%Y-%m-%d")
+            return datetime.fromisoformat(m.group(1))
         except ValueError:
             pass
 
@@ -327,9 +403,15 @@ def parse_signal_date(signal: dict[str, Any]) -> datetime | None:
 def _extract_signal_text(signal: dict[str, Any]) -> tuple[str, str]:
     """Extract combined text and title from a signal in all languages.
 
+    The bilateral, relevance and value filters each need this text, so it
+    is cached on the signal under ``_signal_text`` (dropped again by
+    ``normalize_signal``, before titles/bodies are rewritten).
+
     Returns:
         Tuple of (full_text, title_text) — both lowercased.
     """
+    if "_signal_text" in signal:
+        return signal["_signal_text"]
     title = signal.get("title", "")
     body = signal.get("body_snippet", signal.get("body", ""))
 
@@ -350,6 +432,7 @@ def _extract_signal_text(signal: dict[str, Any]) -> tuple[str, str]:
 
     title_text = " ".join(parts_title).lower()
     full_text = f"{title_text} {' '.join(parts_body)}".lower()
+    signal["_signal_text"] = (full_text, title_text)
     return full_text, title_text
 
 
@@ -512,10 +595,13 @@ def is_bilateral(
     ca_kw = canada_keywords if canada_keywords is not None else _CANADA_KEYWORDS
     cn_kw = china_keywords if china_keywords is not None else _CHINA_KEYWORDS
 
+    ca_re = _keyword_re(tuple(ca_kw))
+    cn_re = _keyword_re(tuple(cn_kw))
+    if ca_re is None or cn_re is None:
+        return False
+
     text, _ = _extract_signal_text(signal)
-    has_canada = any(kw in text for kw in ca_kw)
-    has_china = any(kw in text for kw in cn_kw)
-    return has_canada and has_china
+    return ca_re.search(text) is not None and cn_re.search(text) is not None
 
 
 def filter_and_prioritize_signals(
@@ -543,22 +629,30 @@ def filter_and_prioritize_signals(
     recent: list[dict[str, Any]] = []
     window = windows_hours[-1] if windows_hours else 168
 
+    # Size each window by bisecting the sorted dates, then filter once for
+    # the chosen cutoff so ``recent`` keeps the input order.
+    sorted_dts = sorted(dt for _, dt in dated)
+    cutoff: datetime | None = None
     for w in windows_hours:
         cutoff = target_dt - timedelta(hours=w)
-        recent = [s for s, dt in dated if dt >= cutoff]
         window = w
-        if len(recent) >= min_signals:
+        if len(sorted_dts) - bisect_left(sorted_dts, cutoff) >= min_signals:
             break
+    if cutoff is not None:
+        recent = [s for s, dt in dated if dt >= cutoff]
 
     logger.info(
         "Recency filter: %d dated within %dh + %d undated = %d (of %d total)",
         len(recent), window, len(undated), len(recent) + len(undated), len(signals),
     )
 
-    all_candidates = recent + undated
-
-    bilateral = [s for s in all_candidates if is_bilateral(s, canada_keywords, china_keywords)]
-    general = [s for s in all_candidates if not is_bilateral(s, canada_keywords, china_keywords)]
+    bilateral: list[dict[str, Any]] = []
+    general: list[dict[str, Any]] = []
+    for s in chain(recent, undated):
+        if is_bilateral(s, canada_keywords, china_keywords):
+            bilateral.append(s)
+        else:
+            general.append(s)
 
     def _source_key(signal: dict[str, Any]) -> str:
         src = signal.get("source", "")
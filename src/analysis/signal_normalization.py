@@ -14,6 +14,7 @@ from typing import Any
 from opencc import OpenCC
 
 from analysis.llm import llm_generate_perspectives, llm_summarize
+from analysis.signal_filtering import parse_signal_date
 from analysis.source_detection import is_chinese_source, translate_source_name
 from analysis.text_processing import clean_body_text, summarize_body
 from analysis.translate import (
@@ -22,8 +23,14 @@ from analysis.translate import (
     translate_to_english,
 )
 
-# Traditional → Simplified Chinese converter (singleton)
+# Traditional → Simplified Chinese converter (singleton). Its dictionaries
+# load lazily on first convert(); force that now so concurrent workers
+# never race the initialization.
 _T2S = OpenCC("t2s")
+_T2S.convert("")
+
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+_WHITESPACE_RE = re.compile(r"\s")
 
 logger = logging.getLogger("analysis")
 
@@ -170,13 +177,24 @@ def _load_default_templates() -> None:
 
 
 def to_bilingual(value: Any) -> dict[str, str]:
-    """Ensure a value is in bilingual {"en": ..., "zh": ...} format."""
+    """Ensure a value is in bilingual {"en": ..., "zh": ...} format.
+
+    Complete bilingual dicts are returned as-is; anything else gets a new
+    dict, since translation later fills in the returned value in place.
+    """
     if isinstance(value, dict) and "en" in value:
-        return value
+        if "zh" in value:
+            return value
+        return {**value, "zh": ""}
     text = str(value) if value else ""
     return {"en": text, "zh": text}
 
 
+_WATCH_SEVERITIES = frozenset({"critical", "high"})
+# Read-only stand-in for a missing watch tier; never returned to callers.
+_EMPTY_WATCH_TIER: dict[str, Any] = {}
+
+
 def generate_implications(
     category: str,
     severity: str,
@@ -188,14 +206,26 @@ def generate_implications(
     impacts = impact_templates if impact_templates is not None else _IMPACT_TEMPLATES
     watches = watch_templates if watch_templates is not None else _WATCH_TEMPLATES
 
-    impact = impacts.get(category, impacts.get("diplomatic", {"en": "", "zh": ""}))
-
-    severity_key = severity if severity in ("critical", "high") else "default"
-    watch_tier = watches.get(severity_key, watches.get("default", {"en": {}, "zh": {}}))
-    en_tier = watch_tier.get("en", {})
-    zh_tier = watch_tier.get("zh", {})
-    watch_en = en_tier.get(category, en_tier.get("diplomatic", ""))
-    watch_zh = zh_tier.get(category, zh_tier.get("diplomatic", ""))
+    # Fallbacks are looked up only on a miss; eager ``get`` defaults would
+    # build the empty dicts and probe "diplomatic" on every call.
+    impact = impacts.get(category)
+    if impact is None:
+        impact = impacts.get("diplomatic")
+        if impact is None:
+            impact = {"en": "", "zh": ""}
+
+    severity_key = severity if severity in _WATCH_SEVERITIES else "default"
+    watch_tier = watches.get(severity_key)
+    if watch_tier is None:
+        watch_tier = watches.get("default", _EMPTY_WATCH_TIER)
+    en_tier = watch_tier.get("en", _EMPTY_WATCH_TIER)
+    zh_tier = watch_tier.get("zh", _EMPTY_WATCH_TIER)
+    watch_en = en_tier.get(category)
+    if watch_en is None:
+        watch_en = en_tier.get("diplomatic", "")
+    watch_zh = zh_tier.get(category)
+    if watch_zh is None:
+        watch_zh = zh_tier.get("diplomatic", "")
 
     return {
         "canada_impact": impact,
@@ -559,15 +589,50 @@ def has_english_fragments(text: str, threshold: float = 0.15) -> bool:
 
 def is_primarily_chinese(text: str) -> bool:
     """Check if text is primarily Chinese (CJK characters)."""
-    if not text:
+    # Most titles reaching the quality filter are already English.
+    if not text or text.isascii():
         return False
-    cjk_chars = sum(1 for c in text if '\u4e00' <= c <= '\u9fff')
-    total_chars = sum(1 for c in text if not c.isspace())
+    cjk_chars = len(_CJK_RE.findall(text))
+    total_chars = len(text) - len(_WHITESPACE_RE.findall(text))
     if total_chars == 0:
         return False
     return (cjk_chars / total_chars) > 0.3
 
 
+def _build_implications(
+    s: dict[str, Any],
+    impact_templates: dict[str, dict[str, str]] | None,
+    watch_templates: dict[str, dict[str, dict[str, str]]] | None,
+) -> dict[str, Any]:
+    """Return the signal's implications with bilingual impact/watch fields.
+
+    Missing fields come from the templates. Existing implications are
+    copied rather than updated, so the raw signal's nested dict is not
+    modified.
+    """
+    category = s.get("category", "diplomatic")
+    severity = s.get("severity", "moderate")
+    imp = s.get("implications")
+    if not isinstance(imp, dict):
+        return generate_implications(category, severity, impact_templates, watch_templates)
+
+    generated = None
+    if "canada_impact" in imp:
+        canada_impact = to_bilingual(imp["canada_impact"])
+    else:
+        generated = generate_implications(category, severity, impact_templates, watch_templates)
+        canada_impact = generated["canada_impact"]
+    if imp.get("what_to_watch"):
+        what_to_watch = to_bilingual(imp["what_to_watch"])
+    else:
+        if generated is None:
+            generated = generate_implications(
+                category, severity, impact_templates, watch_templates,
+            )
+        what_to_watch = generated["what_to_watch"]
+    return {**imp, "canada_impact": canada_impact, "what_to_watch": what_to_watch}
+
+
 def normalize_signal(
     signal: dict[str, Any],
     impact_templates: dict[str, dict[str, str]] | None = None,
@@ -582,10 +647,9 @@ def normalize_signal(
 
     Generates summaries and perspectives in the **source language** first.
     The other language is left empty and filled later by
-    ``translate_signals_batch``.
+    ``translate_signals_batch``. ``title``, ``body`` and ``source`` are
+    always returned as dicts with both ``en`` and ``zh`` keys.
     """
-    from analysis.signal_filtering import parse_signal_date
-
     s = dict(signal)
 
     source_lang = s.get("language", "en")
@@ -612,9 +676,13 @@ def normalize_signal(
                 s["body"] = llm_result
 
     # --- Build bilingual shells (populate source-language side only) ---
+    # Downstream consumers index title/body/source as {"en", "zh"} dicts
+    # without type checks, so both keys are always present after this.
     for key in ("title", "body"):
         val = s.get(key, "")
         if isinstance(val, dict) and "en" in val:
+            if "zh" not in val:
+                s[key] = {**val, "zh": ""}
             continue  # already bilingual
         text = str(val) if val else ""
         if gen_lang == "zh":
@@ -625,7 +693,8 @@ def normalize_signal(
     # --- Source name ---
     source_val = s.get("source", "")
     if isinstance(source_val, dict):
-        s["source"] = source_val
+        en_source = source_val.get("en", "")
+        s["source"] = {**source_val, "en": en_source, "zh": source_val.get("zh", en_source)}
     else:
         s["source"] = translate_source_name(str(source_val), name_translations)
 
@@ -637,36 +706,11 @@ def normalize_signal(
             s["date"] = parsed.strftime("%Y-%m-%d")
     else:
         s["date"] = ""
+    s.pop("_parsed_date", None)
+    s.pop("_signal_text", None)
 
     # --- Implications (bilingual templates — no change) ---
-    if "implications" not in s or not isinstance(s["implications"], dict):
-        s["implications"] = generate_implications(
-            s.get("category", "diplomatic"),
-            s.get("severity", "moderate"),
-            impact_templates,
-            watch_templates,
-        )
-    else:
-        imp = s["implications"]
-        if "canada_impact" not in imp:
-            _load_default_templates()
-            impacts = impact_templates if impact_templates is not None else _IMPACT_TEMPLATES
-            imp["canada_impact"] = impacts.get(
-                s.get("category", "diplomatic"),
-                impacts.get("diplomatic", {"en": "", "zh": ""}),
-            )
-        else:
-            imp["canada_impact"] = to_bilingual(imp["canada_impact"])
-        if "what_to_watch" not in imp or not imp["what_to_watch"]:
-            generated = generate_implications(
-                s.get("category", "diplomatic"),
-                s.get("severity", "moderate"),
-                impact_templates,
-                watch_templates,
-            )
-            imp["what_to_watch"] = generated["what_to_watch"]
-        else:
-            imp["what_to_watch"] = to_bilingual(imp["what_to_watch"])
+    s["implications"] = _build_implications(s, impact_templates, watch_templates)
 
     # --- Perspectives (generated in source language) ---
     body_for_perspectives = raw_body if raw_body and not isinstance(raw_body, dict) else ""
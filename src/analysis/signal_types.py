@@ -3,6 +3,15 @@
 TypedDict preserves dict compatibility — no existing code rewrites needed.
 These types document the expected shape of signal dicts as they flow
 through the pipeline: Raw → Classified → Normalized.
+
+Signals stay plain dicts rather than slot-backed structs: fetcher
+payloads carry arbitrary extra keys that are passed through to the
+briefing, and per-signal time is dominated by LLM calls, not field
+access. Expensive derived values are instead cached on the raw dict
+under underscore keys, which ``normalize_signal`` drops:
+
+- ``_parsed_date``: ``signal_filtering.parse_signal_date`` result
+- ``_signal_text``: lowercased (full_text, title_text) used by the filters
 """
 
 from __future__ import annotations
@@ -7,6 +7,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from analysis.memo import identity_memo
+
 # Default data — used when no config-loaded data is provided.
 # Kept as module-level fallback for backward compatibility.
 
@@ -68,24 +70,45 @@ _SOURCE_NAME_TRANSLATIONS: dict[str, str] = {
 }
 
 
+@identity_memo
+def _resolved_names(translations: dict[str, str]) -> dict[str, tuple[str, str]]:
+    """Return the memo of resolved source names for *translations*.
+
+    One (initially empty) memo per translation table, filled by callers.
+    """
+    return {}
+
+
 def translate_source_name(
     source: str,
     name_translations: dict[str, str] | None = None,
 ) -> dict[str, str]:
-    """Translate a source name to bilingual format."""
+    """Translate a source name to bilingual format.
+
+    A run sees only a few dozen distinct sources, so resolved names are
+    memoized per translation table; each call still returns a new dict.
+    """
     if not source:
         return {"en": "", "zh": ""}
 
     translations = name_translations if name_translations is not None else _SOURCE_NAME_TRANSLATIONS
+    memo = _resolved_names(translations)
+    names = memo.get(source)
+    if names is None:
+        names = memo[source] = _resolve_source_name(source, translations)
+    return {"en": names[0], "zh": names[1]}
+
 
+def _resolve_source_name(source: str, translations: dict[str, str]) -> tuple[str, str]:
+    """Map *source* to (en, zh) via exact, then substring, translation match."""
     if source in translations:
-        return {"en": translations[source], "zh": source}
+        return translations[source], source
 
     for zh_name, en_name in translations.items():
         if zh_name in source:
-            return {"en": en_name, "zh": source}
+            return en_name, source
 
-    return {"en": source, "zh": source}
+    return source, source
 
 
 def is_chinese_source(
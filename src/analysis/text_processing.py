@@ -5,7 +5,10 @@ Extracted from cli.py to improve modularity and testability.
 
 from __future__ import annotations
 
+import heapq
 import re
+from functools import lru_cache
+from itertools import islice
 
 # Default patterns — overridable via config
 _FILLER_PATTERNS = [
@@ -83,6 +86,35 @@ _BOILERPLATE_PATTERNS = [
     r"(?:转载|轉載)请注明",
 ]
 
+# Fixed patterns used on every sentence, compiled once at import.
+_WS_RE = re.compile(r"\s+")
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z\u201c\u2018\"\'(])')
+_NUM_RE = re.compile(r'\d+[\d,.]*\s*(?:%|percent|billion|million|thousand|days?|countries)?')
+_PROPER_RE = re.compile(r'[A-Z][a-z]+(?:\s[A-Z][a-z]+)*')
+_WORD_RE = re.compile(r'\b\w{4,}\b')
+_ACTION_RE = re.compile(
+    r'\b(?:announced?|said|allow|permit|grant|require|impose|launch|sign|ban|approv)'
+)
+_LIST_HEAD_RE = re.compile(
+    r'\b\d+\s+(?:way|reason|thing|tip|step|method|sign|trend|takeaway)', re.I
+)
+# A tagged line, whitespace-trimmed like str.strip() on each "\n"-split line.
+_LIST_ITEM_RE = re.compile(r"^[^\S\n]*\[(?:heading|item)\] (.*?\S)[^\S\n]*$", re.M)
+_TAGGED_LINE_RE = re.compile(r"^[^\S\n]*\[(?:heading|item)\][^\n]*", re.M)
+_ECNS_ARTIFACT_RES = (
+    re.compile(r'^\s*\[heading\]\s*Text:AAAPrint[^\n]*\n*', re.IGNORECASE),
+    re.compile(r'^ECNS Wire\s*\(ECNS\)\s*[-–—]\s*', re.IGNORECASE),
+    re.compile(r'^Ecns wire\s*\(ECNS\)\s*[-–—]\s*', re.IGNORECASE),
+)
+
+
+@lru_cache(maxsize=16)
+def _combine_patterns(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile *patterns* into one alternation, or None when there are none."""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{p})" for p in patterns))
+
 
 def clean_body_text(
     text: str,
@@ -115,11 +147,16 @@ def clean_body_text(
 
 def split_sentences(text: str, min_len: int = 15) -> list[str]:
     """Split text into sentences using punctuation boundaries."""
-    text = re.sub(r"\s+", " ", text).strip()
-    raw = re.split(r'(?<=[.!?])\s+(?=[A-Z\u201c\u2018\"\'(])', text)
+    text = _WS_RE.sub(" ", text).strip()
+    raw = _SENT_SPLIT_RE.split(text)
     return [s.strip() for s in raw if s.strip() and len(s.strip()) > min_len]
 
 
+def title_word_set(title: str) -> frozenset[str]:
+    """Return the lower-cased 4+ letter words of *title* used for overlap scoring."""
+    return frozenset(_WORD_RE.findall(title.lower()))
+
+
 def score_sentence(
     sentence: str,
     title: str,
@@ -127,49 +164,50 @@ def score_sentence(
     total: int,
     filler_patterns: list[str] | None = None,
     key_point_patterns: list[str] | None = None,
+    title_words: frozenset[str] | None = None,
 ) -> float:
-    """Score a sentence for informativeness."""
+    """Score a sentence for informativeness.
+
+    ``title_words`` may be passed precomputed (see ``title_word_set``) when
+    scoring many sentences against the same title.
+    """
     filler = filler_patterns if filler_patterns is not None else _FILLER_PATTERNS
     key_points = key_point_patterns if key_point_patterns is not None else _KEY_POINT_PATTERNS
 
     s_lower = sentence.lower()
-    t_lower = title.lower()
+    if title_words is None:
+        title_words = title_word_set(title)
     score = 0.0
 
     # Numbers and data points
-    num_pattern = r'\d+[\d,.]*\s*(?:%|percent|billion|million|thousand|days?|countries)?'
-    numbers = re.findall(num_pattern, sentence)
+    numbers = _NUM_RE.findall(sentence)
     score += len(numbers) * 2.0
 
-    # Proper nouns
-    proper_nouns = re.findall(r'[A-Z][a-z]+(?:\s[A-Z][a-z]+)*', sentence)
-    score += min(len(proper_nouns), 3) * 0.5
+    # Proper nouns (capped at 3, so stop scanning once three are found)
+    proper_nouns = sum(1 for _ in islice(_PROPER_RE.finditer(sentence), 3))
+    score += proper_nouns * 0.5
 
-    # Title word overlap
-    title_words = set(re.findall(r'\b\w{4,}\b', t_lower))
-    sent_words = set(re.findall(r'\b\w{4,}\b', s_lower))
-    overlap = len(title_words & sent_words)
+    # Title word overlap: distinct sentence words found in the title, without
+    # building a set of every word in the sentence.
+    overlap = len(title_words.intersection(_WORD_RE.findall(s_lower))) if title_words else 0
     score += overlap * 3.0
 
     if title_words and overlap == 0:
         score -= 2.0
 
     # Action verbs
-    action_pat = r'\b(?:announced?|said|allow|permit|grant|require|impose|launch|sign|ban|approv)'
-    if re.search(action_pat, s_lower):
+    if _ACTION_RE.search(s_lower):
         score += 1.5
 
-    # Key point patterns
-    for pat in key_points:
-        if re.search(pat, s_lower):
-            score += 2.5
-            break
+    # Key point patterns (one alternation scan instead of a search per pattern)
+    key_point_re = _combine_patterns(tuple(key_points))
+    if key_point_re is not None and key_point_re.search(s_lower):
+        score += 2.5
 
     # Filler penalty
-    for pat in filler:
-        if re.search(pat, s_lower):
-            score -= 4.0
-            break
+    filler_re = _combine_patterns(tuple(filler))
+    if filler_re is not None and filler_re.search(s_lower):
+        score -= 4.0
 
     # Length penalties
     if len(sentence) < 60:
@@ -192,20 +230,12 @@ def score_sentence(
 
 def extract_list_items(text: str) -> list[str]:
     """Extract [heading] and [item] tagged lines from enriched body text."""
-    items: list[str] = []
-    for line in text.split("\n"):
-        line = line.strip()
-        if line.startswith("[heading] "):
-            items.append(line[10:])
-        elif line.startswith("[item] "):
-            items.append(line[7:])
-    return items
+    return _LIST_ITEM_RE.findall(text)
 
 
 def is_list_headline(title: str) -> bool:
     """Check if headline promises a list (e.g. '5 ways', '3 reasons')."""
-    list_pat = r'\b\d+\s+(?:way|reason|thing|tip|step|method|sign|trend|takeaway)'
-    return bool(re.search(list_pat, title, re.I))
+    return _LIST_HEAD_RE.search(title) is not None
 
 
 def remove_boilerplate(
@@ -246,9 +276,8 @@ def summarize_body(
         return ""
 
     # Clean up ECNS-style artifacts
-    text = re.sub(r'^\s*\[heading\]\s*Text:AAAPrint[^\n]*\n*', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'^ECNS Wire\s*\(ECNS\)\s*[-–—]\s*', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'^Ecns wire\s*\(ECNS\)\s*[-–—]\s*', '', text, flags=re.IGNORECASE)
+    for artifact_re in _ECNS_ARTIFACT_RES:
+        text = artifact_re.sub('', text)
 
     # Remove boilerplate
     text = remove_boilerplate(text, boilerplate_patterns)
@@ -269,25 +298,32 @@ def summarize_body(
                 return " • ".join(summary_parts)
 
     # Regular articles: extractive summarization
-    lines = [ln for ln in text.split("\n") if not ln.strip().startswith(("[heading]", "[item]"))]
-    clean = " ".join(lines)
-    sentences = split_sentences(clean)
+    # Drop tagged lines in place; split_sentences collapses the leftover
+    # newlines along with all other whitespace.
+    sentences = split_sentences(_TAGGED_LINE_RE.sub("", text))
     if not sentences:
         return ""
 
-    # Score and rank
-    scored: list[tuple[int, float, str]] = []
-    for i, sent in enumerate(sentences):
-        sc = score_sentence(sent, title, i, len(sentences), filler_patterns, key_point_patterns)
-        scored.append((i, sc, sent))
-
-    by_score = sorted(scored, key=lambda x: -x[1])
+    # Score, then pop best-first from a heap: the budget is usually filled
+    # by the first few sentences, so a full sort is wasted work. Ties keep
+    # document order, as a stable sort on score would.
+    title_words = title_word_set(title)
+    n = len(sentences)
+    heap = [
+        (-score_sentence(
+            sent, title, i, n, filler_patterns, key_point_patterns,
+            title_words=title_words,
+        ), i)
+        for i, sent in enumerate(sentences)
+    ]
+    heapq.heapify(heap)
 
     # Select top sentences within budget
     selected: list[int] = []
     total_len = 0
-    for idx, _sc, sent in by_score:
-        added = len(sent) + (1 if total_len else 0)
+    while heap:
+        _neg_score, idx = heapq.heappop(heap)
+        added = len(sentences[idx]) + (1 if total_len else 0)
         if total_len > 0 and total_len + added > max_chars:
             continue
         selected.append(idx)
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import re
 from datetime import datetime
 from difflib import SequenceMatcher
@@ -184,8 +185,7 @@ def compile_canada_china_timeline(
     # Load existing timeline
     timeline_file = timelines_path / "canada-china.json"
     if timeline_file.exists():
-        with open(timeline_file) as f:
-            timeline = json.load(f)
+        timeline = json.loads(timeline_file.read_bytes())
         # Filter out existing events with invalid translations
         original_count = len(timeline.get("events", []))
         timeline["events"] = [
@@ -202,10 +202,12 @@ def compile_canada_china_timeline(
         timeline = _create_empty_timeline("canada-china")
 
     # Find all daily briefings
-    briefing_dates = sorted([
-        d.name for d in archive_path.iterdir()
-        if d.is_dir() and (d / "briefing.json").exists()
-    ])
+    # scandir yields cached is_dir() results instead of a stat per Path.
+    with os.scandir(archive_path) as it:
+        briefing_dates = sorted(
+            entry.name for entry in it
+            if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "briefing.json"))
+        )
 
     if start_date:
         briefing_dates = [d for d in briefing_dates if d >= start_date]
@@ -224,9 +226,8 @@ def compile_canada_china_timeline(
     for date_str in briefing_dates:
         briefing_file = archive_path / date_str / "briefing.json"
         try:
-            with open(briefing_file) as f:
-                briefing = json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError) as e:
+            briefing = json.loads(briefing_file.read_bytes())
+        except (json.JSONDecodeError, UnicodeDecodeError, FileNotFoundError) as e:
             logger.warning("Skipping %s: %s", date_str, e)
             continue
 
@@ -440,17 +441,25 @@ def mark_signal_as_milestone(
 
     archive_path = Path(archive_dir) / "daily"
 
-    # Search for signal in all briefings
-    for date_dir in archive_path.iterdir():
-        if not date_dir.is_dir():
-            continue
+    # An id that JSON writes verbatim (no escapes) must appear as those
+    # bytes in any briefing that contains it, so other briefings can be
+    # skipped without parsing them.
+    needle = signal_id.encode() if json.dumps(signal_id) == f'"{signal_id}"' else None
+
+    # Search for signal in all briefings; scandir's is_dir() needs no stat.
+    with os.scandir(archive_path) as it:
+        date_dirs = [entry for entry in it if entry.is_dir()]
 
-        briefing_file = date_dir / "briefing.json"
-        if not briefing_file.exists():
+    for date_dir in date_dirs:
+        briefing_file = Path(date_dir.path) / "briefing.json"
+        try:
+            raw = briefing_file.read_bytes()
+        except FileNotFoundError:
+            continue
+        if needle is not None and needle not in raw:
             continue
 
-        with open(briefing_file) as f:
-            briefing = json.load(f)
+        briefing = json.loads(raw)
 
         for signal in briefing.get("signals", []):
             if signal.get("id") == signal_id:
@@ -65,12 +65,12 @@ def _load_previous_briefing(
     ]
 
     for path in paths_to_try:
-        if path.exists():
-            try:
-                with open(path, encoding="utf-8") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, OSError) as exc:
-                logger.warning("Failed to load previous briefing from %s: %s", path, exc)
+        try:
+            return json.loads(path.read_bytes())
+        except FileNotFoundError:
+            continue
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as exc:
+            logger.warning("Failed to load previous briefing from %s: %s", path, exc)
 
     logger.info("No previous briefing found for %s", prev_date)
     return None
@@ -8,10 +8,14 @@ from __future__ import annotations
 
 import json
 import logging
-from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 
+from analysis.signal_filtering import _LOAD_WORKERS
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,57 +36,68 @@ def _get_month_range(reference_date: str) -> tuple[date, date]:
 
     # Go to first day of current month, then back one day for last day of prev month
     first_of_month = ref.replace(day=1)
-    last_of_prev = first_of_month - __import__("datetime").timedelta(days=1)
+    last_of_prev = first_of_month - timedelta(days=1)
     first_of_prev = last_of_prev.replace(day=1)
 
     return first_of_prev, last_of_prev
 
 
+def _load_daily_briefing(archive_path: Path, date_str: str) -> dict[str, Any] | None:
+    """Load one day's briefing (directory or flat layout), or None if absent."""
+    # Try directory format: daily/{date}/briefing.json
+    file_path = archive_path / date_str / "briefing.json"
+    if not file_path.exists():
+        # Try flat format: daily/{date}.json
+        file_path = archive_path / f"{date_str}.json"
+
+    try:
+        data = json.loads(file_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError) as exc:
+        logger.warning("Failed to load briefing for %s: %s", date_str, exc)
+        return None
+    data["_date"] = date_str
+    return data
+
+
 def _load_daily_briefings(
     start_date: date,
     end_date: date,
     archive_dir: str,
+    max_workers: int = _LOAD_WORKERS,
 ) -> list[dict[str, Any]]:
     """Load all daily briefing files within a date range.
 
+    A month of full briefings is read on a thread pool; ``pool.map`` keeps
+    the results in date order.
+
     Args:
         start_date: Start of range (inclusive).
         end_date: End of range (inclusive).
         archive_dir: Path to archive directory.
+        max_workers: Reader threads (``CC_LOAD_WORKERS``); 1 reads serially.
 
     Returns:
         List of briefing dicts, sorted by date.
     """
-    briefings: list[dict[str, Any]] = []
     archive_path = Path(archive_dir) / "daily"
 
     if not archive_path.exists():
         logger.warning("Archive daily directory not found: %s", archive_path)
-        return briefings
-
-    current = start_date
-    delta = __import__("datetime").timedelta(days=1)
-    while current <= end_date:
-        date_str = current.strftime("%Y-%m-%d")
-
-        # Try directory format: daily/{date}/briefing.json
-        file_path = archive_path / date_str / "briefing.json"
-        if not file_path.exists():
-            # Try flat format: daily/{date}.json
-            file_path = archive_path / f"{date_str}.json"
-
-        if file_path.exists():
-            try:
-                with open(file_path, encoding="utf-8") as f:
-                    data = json.load(f)
-                data["_date"] = date_str
-                briefings.append(data)
-            except (json.JSONDecodeError, OSError) as exc:
-                logger.warning("Failed to load briefing for %s: %s", date_str, exc)
-
-        current += delta
-
-    return briefings
+        return []
+
+    date_strs = [
+        (start_date + timedelta(days=i)).strftime("%Y-%m-%d")
+        for i in range((end_date - start_date).days + 1)
+    ]
+    if max_workers <= 1 or len(date_strs) <= 1:
+        loaded = [_load_daily_briefing(archive_path, d) for d in date_strs]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(date_strs))) as pool:
+            loaded = list(pool.map(_load_daily_briefing, repeat(archive_path), date_strs))
+
+    return [b for b in loaded if b is not None]
 
 
 def _compute_next_volume_number(archive_dir: str) -> int:
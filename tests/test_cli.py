@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 import json
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 from click.testing import CliRunner
 
-from analysis.cli import main
+from analysis.cli import (
+    _classify_signals,
+    _load_config_cached,
+    _resolve_path,
+    _slugify,
+    main,
+)
+from analysis.config import PROJECT_ROOT, load_config
 from analysis.text_processing import score_sentence as _score_sentence
 from analysis.text_processing import summarize_body as _summarize_body
 
@@ -190,6 +199,63 @@ class TestRunCommand:
         assert result.exit_code == 0
 
 
+class TestClassifySignals:
+    """Test concurrent per-signal classification."""
+
+    def test_preserves_input_order(self) -> None:
+        config = load_config(env="dev")
+        signals = [
+            {"title": f"China trade tariff update {i}", "body": "", "date": "2025-01-30"}
+            for i in range(6)
+        ]
+        serial = _classify_signals(signals, config, max_workers=1)
+        threaded = _classify_signals(signals, config, max_workers=4)
+        assert [s["id"] for s in threaded] == [s["id"] for s in serial]
+        assert [s["category"] for s in threaded] == [s["category"] for s in serial]
+
+    def test_untitled_signal_gets_positional_id(self) -> None:
+        config = load_config(env="dev")
+        signals = [{"title": "China trade talks", "body": ""}, {"body": ""}]
+        result = _classify_signals(signals, config, max_workers=2)
+        assert result[1]["id"] == "signal-1"
+
+    def test_tags_inputs_and_returns_separate_dicts(self) -> None:
+        config = load_config(env="dev")
+        signals = [{"title": "China trade talks", "body": ""}]
+        result = _classify_signals(signals, config, max_workers=1)
+        assert result[0] is not signals[0]
+        assert signals[0]["id"] == result[0]["id"] == "china-trade-talks"
+        assert signals[0]["category"] == result[0]["category"]
+        assert isinstance(signals[0]["title"], str)
+
+
+class TestSlugify:
+    def test_ascii_title(self) -> None:
+        title = "Canada And China Resume Talks On Canola Tariffs After Long Pause In 2025"
+        assert _slugify(title) == title.lower().replace(" ", "-")[:50]
+        assert len(_slugify(title)) == 50
+
+    def test_non_ascii_title(self) -> None:
+        assert _slugify("Émile Visits Beijing") == "émile-visits-beijing"
+        assert _slugify("中国 贸易") == "中国-贸易"
+
+
+class TestLoadConfigCached:
+    def test_reuses_config_per_env(self) -> None:
+        assert _load_config_cached("dev") is _load_config_cached("dev")
+        assert _load_config_cached("prod").env == "prod"
+
+
+class TestResolvePath:
+    def test_relative_paths_resolve_under_project_root(self) -> None:
+        resolved = _resolve_path("config/../config")
+        assert resolved == (PROJECT_ROOT / "config").resolve()
+        assert _resolve_path("config/../config") is resolved
+
+    def test_absolute_paths_pass_through(self, tmp_path: Path) -> None:
+        assert _resolve_path(str(tmp_path)) == tmp_path
+
+
 class TestCompileVolumeCommand:
     """Test the 'compile-volume' command."""
 
@@ -258,6 +324,20 @@ class TestHelpOutput:
         assert result.exit_code == 0
         assert "0.1.0" in result.output
 
+    def test_version_and_help_skip_pipeline_imports(self) -> None:
+        # Run in a fresh interpreter: this test session has already
+        # imported the config and pipeline modules.
+        code = (
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from analysis.cli import main\n"
+            "for args in (['--version'], ['--help'], ['run', '--help']):\n"
+            "    assert CliRunner().invoke(main, args).exit_code == 0, args\n"
+            "loaded = {'analysis.config', 'yaml', 'analysis.signal_filtering'} & set(sys.modules)\n"
+            "assert not loaded, loaded\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
 
 class TestScoreSentence:
     """Tests for _score_sentence title-relevance scoring."""
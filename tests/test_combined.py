@@ -0,0 +1,56 @@
+"""Tests for single-call signal classification."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from analysis.classifiers.category import validation_text
+from analysis.classifiers.combined import classify_all
+
+
+class TestClassifyAll:
+    def test_diplomatic_signal(
+        self,
+        sample_diplomatic_signal: dict[str, Any],
+        categories_dict: dict[str, dict[str, list[str]]],
+        severity_modifiers: dict[str, Any],
+    ) -> None:
+        # official (4) + escalation keywords (2) + bilateral (2) + older than a week (-1)
+        assert classify_all(sample_diplomatic_signal, categories_dict, severity_modifiers) == (
+            "diplomatic", "high", "official",
+        )
+
+    def test_severity_without_modifiers(
+        self,
+        sample_diplomatic_signal: dict[str, Any],
+        categories_dict: dict[str, dict[str, list[str]]],
+    ) -> None:
+        assert classify_all(sample_diplomatic_signal, categories_dict) == (
+            "diplomatic", "elevated", "official",
+        )
+
+    def test_trade_signal_from_wire_source(
+        self, categories_dict: dict[str, dict[str, list[str]]],
+    ) -> None:
+        signal = {
+            "title": "New tariff on canola as anti-dumping duties rise",
+            "body": "The export ban and import quota follow a trade dispute.",
+            "source": "Reuters",
+        }
+        category, _, tier = classify_all(signal, categories_dict)
+        assert category == "trade"
+        assert tier == "wire"
+
+    def test_empty_signal(self, categories_dict: dict[str, dict[str, list[str]]]) -> None:
+        assert classify_all({}, categories_dict) == ("political", "low", "media")
+
+
+class TestValidationText:
+    def test_joins_title_and_first_body_field(self) -> None:
+        signal = {
+            "title": {"en": "Talks", "zh": "会谈"},
+            "body_text": "Full text",
+            "body": "",
+            "summary": "ignored",
+        }
+        assert validation_text(signal) == "Talks 会谈 Full text"
@@ -5,10 +5,13 @@ from __future__ import annotations
 from pathlib import Path
 
 import pytest
+import yaml
 
 from analysis.config import (
     TemplateData,
     ThresholdsConfig,
+    _load_yaml,
+    _load_yaml_optional,
     detect_env,
     load_config,
 )
@@ -27,6 +30,12 @@ class TestDetectEnv:
 
 
 class TestLoadConfig:
+    def test_env_from_cc_env_is_read_per_call(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("CC_ENV", "dev")
+        assert load_config().env == "dev"
+        monkeypatch.setenv("CC_ENV", "prod")
+        assert load_config().env == "prod"
+
     def test_loads_dev_config(self) -> None:
         config = load_config("dev")
         assert config.env == "dev"
@@ -84,3 +93,26 @@ class TestTemplateData:
             impact_templates={"test": {"en": "a", "zh": "b"}},
         )
         assert "test" in t.impact_templates
+
+
+class TestYamlCache:
+    def test_reuses_parse_until_file_changes(self, tmp_path: Path) -> None:
+        path = tmp_path / "conf.yaml"
+        path.write_text("a: 1\n", encoding="utf-8")
+        first = _load_yaml(path)
+        assert first == {"a": 1}
+        assert _load_yaml(path) is first
+
+        path.write_text("a: 22\n", encoding="utf-8")
+        assert _load_yaml(path) == {"a": 22}
+
+    def test_missing_files(self, tmp_path: Path) -> None:
+        assert _load_yaml_optional(tmp_path / "absent.yaml") == {}
+        with pytest.raises(FileNotFoundError, match="Config file not found"):
+            _load_yaml(tmp_path / "absent.yaml")
+
+    def test_loader_matches_pure_python_parse(self, config_dir: Path) -> None:
+        for path in sorted(config_dir.rglob("*.yaml")):
+            with open(path, encoding="utf-8") as f:
+                expected = yaml.safe_load(f) or {}
+            assert _load_yaml(path) == expected, path
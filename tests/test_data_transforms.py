@@ -4,7 +4,11 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Any
 
+import pytest
+
+from analysis import data_transforms
 from analysis.data_transforms import (
     determine_volume_number,
     extract_market_signals,
@@ -43,6 +47,20 @@ class TestTransformMarketData:
         result = transform_market_data(raw)
         assert result["indices"][0]["sparkline_points"] != ""
 
+    def test_sparkline_points_layout(self) -> None:
+        raw = {
+            "indices": [
+                {"name": "HSI", "value": 20000, "change_pct": 0,
+                 "sparkline": [100, 110, 105]},
+                {"name": "SSE", "value": 3000, "change_pct": 0, "sparkline": [5]},
+            ],
+            "sectors": [], "movers": {"gainers": [], "losers": []},
+            "currency_pairs": [],
+        }
+        result = transform_market_data(raw)
+        assert result["indices"][0]["sparkline_points"] == "0,32.0 50,2.0 100,17.0"
+        assert result["indices"][1]["sparkline_points"] == ""
+
     def test_currency_pairs(self) -> None:
         raw = {
             "indices": [], "sectors": [],
@@ -82,6 +100,21 @@ class TestTransformTradeData:
         assert len(result["commodity_table"]) == 1
         assert result["commodity_table"][0]["trend"]["en"] == "Increasing"
 
+    def test_commodity_trend_labels(self) -> None:
+        raw = {
+            "commodities": [
+                {"name": "Canola", "trend": "Disrupted"},
+                {"name": "Lobster", "trend": "seasonal"},
+                {"name": "Pork", "trend": None},
+            ],
+        }
+        table = transform_trade_data(raw)["commodity_table"]
+        assert table[0]["trend"] == {"en": "Disrupted", "zh": "中断"}
+        assert table[0]["disrupted"] is True
+        assert table[1]["trend"] == {"en": "seasonal", "zh": "seasonal"}
+        assert table[2]["trend"] == {"en": "Stable", "zh": "稳定"}
+        assert table[2]["disrupted"] is False
+
 
 class TestTransformParliamentData:
     def test_basic_transform(self) -> None:
@@ -110,11 +143,33 @@ class TestLoadSupplementaryData:
         result = load_supplementary_data(str(tmp_path))
         assert result["market_data"] is not None
 
+    def test_falls_back_past_invalid_file(self, tmp_path: Path) -> None:
+        (tmp_path / "statcan.json").write_text("{broken", encoding="utf-8")
+        trade = {"data": {"imports_cad_millions": 10, "exports_cad_millions": 5}}
+        with open(tmp_path / "trade.json", "w") as f:
+            json.dump(trade, f)
+        result = load_supplementary_data(str(tmp_path))
+        assert result["trade_data"] is not None
+
+    def test_ignores_directory_with_known_name(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        (tmp_path / "statcan.json").mkdir()
+        trade = {"data": {"imports_cad_millions": 10, "exports_cad_millions": 5}}
+        (tmp_path / "trade.json").write_text(json.dumps(trade), encoding="utf-8")
+        result = load_supplementary_data(str(tmp_path))
+        assert result["trade_data"] is not None
+        assert "Failed to load" not in caplog.text
+
     def test_handles_missing_files(self, tmp_path: Path) -> None:
         result = load_supplementary_data(str(tmp_path))
         assert result["market_data"] is None
         assert result["trade_data"] is None
 
+    def test_missing_raw_dir(self, tmp_path: Path) -> None:
+        result = load_supplementary_data(str(tmp_path / "nope"))
+        assert result == {"trade_data": None, "market_data": None, "parliament": None}
+
 
 class TestDetermineVolumeNumber:
     def test_empty_archive(self, tmp_path: Path) -> None:
@@ -127,6 +182,90 @@ class TestDetermineVolumeNumber:
             json.dump({"volume": 5}, f)
         assert determine_volume_number(str(tmp_path)) == 6
 
+    def test_uses_newest_briefing(self, tmp_path: Path) -> None:
+        for day, vol in (("2025-01-28", 9), ("2025-01-29", 3), ("2025-01-30", 4)):
+            daily = tmp_path / "daily" / day
+            daily.mkdir(parents=True)
+            with open(daily / "briefing.json", "w") as f:
+                json.dump({"volume": vol}, f)
+        assert determine_volume_number(str(tmp_path)) == 5
+        assert determine_volume_number(str(tmp_path), rescan=True) == 10
+
+    def test_rescan_with_zero_load_workers(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        for day, vol in (("2025-01-29", 9), ("2025-01-30", 4)):
+            daily = tmp_path / "daily" / day
+            daily.mkdir(parents=True)
+            (daily / "briefing.json").write_text(json.dumps({"volume": vol}), encoding="utf-8")
+        monkeypatch.setattr(data_transforms, "_LOAD_WORKERS", 0)
+        assert determine_volume_number(str(tmp_path), rescan=True) == 10
+
+    def test_stops_at_newest_readable_entry(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        for day in ("2025-01-28", "2025-01-29", "2025-01-30"):
+            daily = tmp_path / "daily" / day
+            daily.mkdir(parents=True)
+            (daily / "briefing.json").write_text('{"volume": 3}', encoding="utf-8")
+        seen: list[str] = []
+        original = data_transforms._briefing_path
+
+        def tracking(entry: Any) -> str | None:
+            seen.append(entry.name)
+            return original(entry)
+
+        monkeypatch.setattr(data_transforms, "_briefing_path", tracking)
+        assert determine_volume_number(str(tmp_path)) == 4
+        assert seen == ["2025-01-30"]
+
+    def test_skips_unreadable_newest(self, tmp_path: Path) -> None:
+        older = tmp_path / "daily" / "2025-01-29"
+        older.mkdir(parents=True)
+        with open(older / "briefing.json", "w") as f:
+            json.dump({"volume": 7}, f)
+        newest = tmp_path / "daily" / "2025-01-30"
+        newest.mkdir(parents=True)
+        (newest / "briefing.json").write_text("{not json", encoding="utf-8")
+        assert determine_volume_number(str(tmp_path)) == 8
+
+    def test_reads_volume_from_briefing_head(self, tmp_path: Path) -> None:
+        daily = tmp_path / "daily" / "2025-01-30"
+        daily.mkdir(parents=True)
+        head = json.dumps({"date": "2025-01-30", "volume": 41}, indent=2)
+        # Only the leading date/volume pair should be parsed.
+        (daily / "briefing.json").write_text(head[:-2] + ',\n  "signals": [', encoding="utf-8")
+        assert determine_volume_number(str(tmp_path)) == 42
+
+    def test_head_skips_scalar_members_but_not_nested_volume(self, tmp_path: Path) -> None:
+        first = tmp_path / "daily" / "2025-01-30"
+        first.mkdir(parents=True)
+        (first / "briefing.json").write_text(
+            '{"title": "x", "draft": false, "volume": 12, "signals": [', encoding="utf-8"
+        )
+        assert determine_volume_number(str(tmp_path)) == 13
+        (first / "briefing.json").write_text(
+            json.dumps({"meta": {"volume": 99}, "volume": 3}), encoding="utf-8"
+        )
+        assert determine_volume_number(str(tmp_path)) == 4
+
+    def test_ignores_undated_entries(self, tmp_path: Path) -> None:
+        for name, vol in (("2025-01-30", 4), ("latest", 90)):
+            day = tmp_path / "daily" / name
+            day.mkdir(parents=True)
+            (day / "briefing.json").write_text(json.dumps({"volume": vol}), encoding="utf-8")
+        (tmp_path / "daily" / "index.json").write_text('{"volume": 99}', encoding="utf-8")
+        assert determine_volume_number(str(tmp_path)) == 5
+        assert determine_volume_number(str(tmp_path), rescan=True) == 5
+
+    def test_flat_briefing_files(self, tmp_path: Path) -> None:
+        daily = tmp_path / "daily"
+        daily.mkdir()
+        with open(daily / "2025-01-30.json", "w") as f:
+            json.dump({"volume": 2}, f)
+        (daily / "notes.txt").write_text("ignored", encoding="utf-8")
+        assert determine_volume_number(str(tmp_path)) == 3
+
 
 class TestGenerateTodaysNumber:
     def test_from_trade_data(self) -> None:
@@ -139,29 +278,106 @@ class TestGenerateTodaysNumber:
         result = generate_todays_number(supplementary, [])
         assert "B" in result["value"]["en"] or "M" in result["value"]["en"]
 
+    def test_formats_billions_and_millions(self) -> None:
+        supplementary = {
+            "trade_data": {
+                "totals": {"total_imports_cad": 5000, "total_exports_cad": 750},
+                "reference_period": "2025-01-01",
+            }
+        }
+        result = generate_todays_number(supplementary, [])
+        assert result["value"]["en"] == "$5.8B"
+        assert result["imports"]["en"] == "$5.0B"
+        assert result["exports"] == {"en": "$750M", "zh": "750百万加元"}
+
+    def test_reference_period_labels(self) -> None:
+        supplementary = {
+            "trade_data": {
+                "totals": {"total_imports_cad": 5000, "total_exports_cad": 750},
+                "reference_period": "2025-11-01",
+            }
+        }
+        result = generate_todays_number(supplementary, [])
+        assert result["description"]["en"] == "Canada-China bilateral trade (November 2025)"
+        assert result["description"]["zh"] == "加中双边贸易总额（2025年11月）"
+
+    def test_malformed_reference_period_kept_verbatim(self) -> None:
+        supplementary = {
+            "trade_data": {
+                "totals": {"total_imports_cad": 5000, "total_exports_cad": 750},
+                "reference_period": "2025-13",
+            }
+        }
+        result = generate_todays_number(supplementary, [])
+        assert result["description"]["en"] == "Canada-China bilateral trade (2025-13)"
+
+    @pytest.mark.parametrize("period", [None, "", "2025-1", "2025"])
+    def test_missing_or_short_reference_period(self, period: Any) -> None:
+        supplementary = {
+            "trade_data": {
+                "totals": {"total_imports_cad": 5000, "total_exports_cad": 750},
+                "reference_period": period,
+            }
+        }
+        result = generate_todays_number(supplementary, [])
+        assert result["value"]["en"] == "$5.8B"
+        assert result["reference_period"] == period
+        assert result["description"]["en"] == f"Canada-China bilateral trade ({period})"
+
     def test_fallback_to_signal_count(self) -> None:
         result = generate_todays_number({}, [{"id": 1}, {"id": 2}])
         assert result["value"]["en"] == "2"
 
 
+def _normalized(title: str, body: str = "", source: str = "", **fields: Any) -> dict[str, Any]:
+    """Build a signal in the bilingual shape produced by normalize_signal."""
+    return {
+        "title": {"en": title, "zh": ""},
+        "body": {"en": body, "zh": ""},
+        "source": {"en": source, "zh": source},
+        **fields,
+    }
+
+
 class TestIsRegulatory:
     def test_regulatory_signal(self) -> None:
-        assert is_regulatory({"title": "SAMR launches antitrust investigation"})
+        assert is_regulatory(_normalized("SAMR launches antitrust investigation"))
 
     def test_non_regulatory(self) -> None:
-        assert not is_regulatory({"title": "China announces new policy"})
+        assert not is_regulatory(_normalized("China announces new policy"))
+
+    def test_mixed_script_text(self) -> None:
+        signal = _normalized("\u5e02\u573a\u76d1\u7ba1 SAMR Probe", "Regulators opened a case.")
+        assert is_regulatory(signal)
+
+    def test_dropped_characters_do_not_join_words(self) -> None:
+        assert not is_regulatory(_normalized("pro\u4e2dbe"))
+
+    def test_non_ascii_custom_keywords(self) -> None:
+        signal = _normalized("\u5e02\u573a\u76d1\u7ba1\u603b\u5c40\u7acb\u6848\u8c03\u67e5")
+        assert is_regulatory(signal, regulatory_keywords=["\u7acb\u6848"])
+        assert not is_regulatory(signal, regulatory_keywords=["antitrust"])
 
 
 class TestExtractMarketSignals:
     def test_extracts_by_category(self) -> None:
         signals = [
-            {"category": "trade", "severity": "high", "title": "Trade news"},
-            {"category": "diplomatic", "severity": "high", "title": "Diplomatic news"},
-            {"category": "economic", "severity": "moderate", "title": "Economic news"},
+            _normalized("Trade news", category="trade", severity="high"),
+            _normalized("Diplomatic news", category="diplomatic", severity="high"),
+            _normalized("Economic news", category="economic", severity="moderate"),
         ]
         market, regulatory = extract_market_signals(signals)
         assert len(market) == 2  # trade + economic
 
+    def test_keeps_most_severe_in_input_order(self) -> None:
+        severities = ["low", "high", "moderate", "high", "critical", "low"]
+        signals = [
+            _normalized(f"Trade {i}", category="trade", severity=sev)
+            for i, sev in enumerate(severities)
+        ]
+        market, _ = extract_market_signals(signals, max_count=3)
+        assert [s["title"]["en"] for s in market] == ["Trade 4", "Trade 1", "Trade 3"]
+
 
 class TestGenerateQuote:
     def test_prefers_bilateral(self) -> None:
@@ -174,6 +390,41 @@ class TestGenerateQuote:
         result = generate_quote(signals)
         assert "Canada" in result["text"]["en"]
 
+    def test_tiebreaks_on_severity_then_source(self) -> None:
+        signals = [
+            _normalized("China tariff news", source="Reuters",
+                        severity="moderate", date="2025-01-30"),
+            _normalized("China sanctions update", source="Reuters",
+                        severity="high", date="2025-01-30"),
+            _normalized("China export controls", source="Xinhua",
+                        severity="high", date="2025-01-30"),
+        ]
+        result = generate_quote(signals)
+        assert result["text"]["en"] == "\u201cChina export controls\u201d"
+
+    def test_relevance_keywords_ignore_case(self) -> None:
+        signals = [
+            _normalized("BEIJING responds to tariffs", source="Reuters", severity="high"),
+            _normalized("OTTAWA and BEIJING resume talks", source="Reuters", severity="low"),
+        ]
+        result = generate_quote(signals)
+        assert result["text"]["en"] == "\u201cOTTAWA and BEIJING resume talks\u201d"
+
+    def test_ties_keep_first_signal(self) -> None:
+        signals = [
+            _normalized("China trade first", source="Reuters", severity="high", date="2025-01-30"),
+            _normalized("China trade second", source="Reuters", severity="high", date="2025-01-30"),
+        ]
+        result = generate_quote(signals)
+        assert result["text"]["en"] == "\u201cChina trade first\u201d"
+
+    def test_stops_at_perfect_score(self) -> None:
+        perfect = _normalized("Canada and China sign accord", source="Global Affairs Canada",
+                              severity="critical", date="2025-01-30")
+        # Anything after the perfect candidate is never scored.
+        result = generate_quote([perfect, {"title": None}])
+        assert result["text"]["en"] == "\u201cCanada and China sign accord\u201d"
+
     def test_empty_signals(self) -> None:
         result = generate_quote([])
         assert result["text"]["en"] == ""
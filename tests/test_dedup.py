@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import logging
 from pathlib import Path
 
 from analysis.dedup import (
@@ -227,6 +228,20 @@ class TestLoadRecentSignals:
         assert len(result) == 1
         assert result[0]["title"] == "Archived Signal"
 
+    def test_unreadable_processed_falls_back_to_archive(self, tmp_path):
+        proc = tmp_path / "processed" / "2026-01-31"
+        proc.mkdir(parents=True)
+        (proc / "briefing.json").write_bytes(b'{"signals": [{"title": "\xff"}]}')
+        archive = tmp_path / "archive"
+        self._write_briefing(
+            archive / "daily" / "2026-01-31" / "briefing.json",
+            [{"title": "Archived Signal"}],
+        )
+        result = load_recent_signals(
+            str(tmp_path / "processed"), str(archive), "2026-02-01", lookback_days=1,
+        )
+        assert [s["title"] for s in result] == ["Archived Signal"]
+
     def test_loads_multiple_days(self, tmp_path):
         proc = tmp_path / "processed"
         self._write_briefing(
@@ -293,6 +308,18 @@ class TestDeduplicateSignals:
         assert len(result) == 1
         assert stats.dropped_title == 1
 
+    def test_drop_logged_at_debug_only(self, caplog):
+        signals = [
+            {"title": "Article A", "source_url": "https://scmp.com/123"},
+            {"title": "Different title", "source_url": "https://scmp.com/123"},
+        ]
+        with caplog.at_level(logging.INFO, logger="analysis.dedup"):
+            deduplicate_signals(signals)
+        assert "Dedup (same-day" not in caplog.text
+        with caplog.at_level(logging.DEBUG, logger="analysis.dedup"):
+            deduplicate_signals(signals)
+        assert "dropped 'Different title' (matches 'Article A')" in caplog.text
+
     def test_cross_day_dedup(self):
         current = [
             {"title": "China announces semiconductor restrictions"},
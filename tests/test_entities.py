@@ -99,6 +99,11 @@ class TestMatchEntitiesInSignal:
         result = match_entities_in_signal(signal, entity_aliases)
         assert "canola" in result
 
+    def test_mixed_case_aliases_per_table(self) -> None:
+        signal = {"title": "Talks with the WTO panel", "body": ""}
+        assert match_entities_in_signal(signal, {"wto": {"en": ["WTO"]}}) == ["wto"]
+        assert match_entities_in_signal(signal, {"wto": {"en": ["World Trade"]}}) == []
+
 
 class TestMatchEntitiesAcrossSignals:
     """Test entity matching across multiple signals."""
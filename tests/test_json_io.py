@@ -0,0 +1,25 @@
+"""Tests for json_io module."""
+
+from __future__ import annotations
+
+import json
+import math
+
+import pytest
+
+from analysis.json_io import loads
+
+
+class TestLoads:
+    def test_decodes_utf8_bytes(self) -> None:
+        raw = json.dumps({"title": "贸易", "n": [1, 2]}, ensure_ascii=False).encode("utf-8")
+        assert loads(raw) == {"title": "贸易", "n": [1, 2]}
+
+    def test_accepts_stdlib_extensions(self) -> None:
+        data = loads(b'{"close": NaN, "big": 123456789012345678901234567890}')
+        assert math.isnan(data["close"])
+        assert data["big"] == 123456789012345678901234567890
+
+    def test_invalid_json_raises_decode_error(self) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            loads(b'{"title": ')
@@ -0,0 +1,48 @@
+"""Tests for memo module."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from analysis.memo import _MAX_ENTRIES, identity_memo
+
+
+class TestIdentityMemo:
+    def test_builds_once_per_object(self) -> None:
+        calls: list[int] = []
+
+        @identity_memo
+        def size(table: dict[str, Any]) -> int:
+            calls.append(1)
+            return len(table)
+
+        table = {"a": 1}
+        assert size(table) == 1
+        assert size(table) == 1
+        assert size({"a": 1, "b": 2}) == 2
+        assert len(calls) == 2
+
+    def test_equal_but_distinct_objects_are_separate(self) -> None:
+        @identity_memo
+        def fresh(table: dict[str, Any]) -> dict[str, Any]:
+            return {}
+
+        first, second = {"a": 1}, {"a": 1}
+        assert fresh(first) is fresh(first)
+        assert fresh(first) is not fresh(second)
+
+    def test_cache_is_bounded(self) -> None:
+        calls: list[int] = []
+
+        @identity_memo
+        def build(table: list[int]) -> int:
+            calls.append(1)
+            return len(table)
+
+        tables = [[i] for i in range(_MAX_ENTRIES + 1)]
+        for t in tables:
+            build(t)
+        build(tables[-1])
+        assert len(calls) == _MAX_ENTRIES + 1
+        build(tables[0])
+        assert len(calls) == _MAX_ENTRIES + 2
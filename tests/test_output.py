@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 from analysis.output import (
+    _briefing_validator,
     assemble_briefing,
+    encode_briefing,
     validate_briefing,
     write_archive,
     write_processed,
@@ -74,6 +77,14 @@ class TestWriteProcessed:
         latest = tmp_path / "latest" / "briefing.json"
         assert latest.exists()
 
+    def test_latest_matches_and_keeps_chinese_unescaped(self, tmp_path: Path) -> None:
+        briefing = {"date": "2025-01-30", "title": {"en": "Trade", "zh": "贸易"}}
+        path = write_processed("2025-01-30", briefing, str(tmp_path))
+        text = path.read_text(encoding="utf-8")
+        assert '"zh": "贸易"' in text
+        assert (tmp_path / "latest" / "briefing.json").read_text(encoding="utf-8") == text
+        assert json.loads(text) == briefing
+
 
 class TestWriteArchive:
     def test_writes_archive(self, tmp_path: Path) -> None:
@@ -82,6 +93,14 @@ class TestWriteArchive:
         assert path.exists()
         assert "daily" in str(path)
 
+    def test_reuses_encoded_bytes(self, tmp_path: Path) -> None:
+        briefing = {"date": "2025-01-30", "title": {"en": "Trade", "zh": "贸易"}}
+        encoded = encode_briefing(briefing)
+        processed = write_processed("2025-01-30", briefing, str(tmp_path / "p"), encoded=encoded)
+        archived = write_archive("2025-01-30", briefing, str(tmp_path / "a"), encoded=encoded)
+        assert processed.read_bytes() == archived.read_bytes() == encoded
+        assert json.loads(encoded) == briefing
+
 
 class TestValidateBriefing:
     def test_no_schema_dir(self) -> None:
@@ -89,3 +108,41 @@ class TestValidateBriefing:
 
     def test_missing_schema_file(self, tmp_path: Path) -> None:
         assert validate_briefing({}, schemas_dir=str(tmp_path)) is True
+
+    def test_reuses_validator_until_schema_changes(self, tmp_path: Path) -> None:
+        schema_file = tmp_path / "briefing.schema.json"
+        schema = {"type": "object", "required": ["date"]}
+        schema_file.write_text(json.dumps(schema), encoding="utf-8")
+        _briefing_validator.cache_clear()
+
+        assert validate_briefing({"date": "2025-01-30"}, schemas_dir=str(tmp_path)) is True
+        assert validate_briefing({}, schemas_dir=str(tmp_path)) is False
+        assert _briefing_validator.cache_info().misses == 1
+
+        schema["required"] = ["volume"]
+        schema_file.write_text(json.dumps(schema), encoding="utf-8")
+        st = schema_file.stat()
+        os.utime(schema_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert validate_briefing({"date": "2025-01-30"}, schemas_dir=str(tmp_path)) is False
+        assert _briefing_validator.cache_info().misses == 2
+
+    def test_rebuilds_validator_when_referenced_schema_changes(self, tmp_path: Path) -> None:
+        date_id = "https://example.com/schemas/date.schema.json"
+        briefing_schema = {
+            "type": "object",
+            "properties": {"date": {"$ref": date_id}},
+        }
+        (tmp_path / "briefing.schema.json").write_text(
+            json.dumps(briefing_schema), encoding="utf-8",
+        )
+        date_file = tmp_path / "date.schema.json"
+        date_file.write_text(json.dumps({"$id": date_id, "type": "string"}), encoding="utf-8")
+        _briefing_validator.cache_clear()
+
+        assert validate_briefing({"date": "2025-01-30"}, schemas_dir=str(tmp_path)) is True
+
+        date_file.write_text(json.dumps({"$id": date_id, "type": "integer"}), encoding="utf-8")
+        st = date_file.stat()
+        os.utime(date_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert validate_briefing({"date": "2025-01-30"}, schemas_dir=str(tmp_path)) is False
+        assert _briefing_validator.cache_info().misses == 2
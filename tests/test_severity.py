@@ -124,6 +124,24 @@ class TestComputeSeverityScore:
         )
         assert score >= 0
 
+    def test_modifier_keywords_match_case_insensitively(self) -> None:
+        modifiers = {
+            "escalation": {"weight": 3, "en": ["Sanctions"], "zh": ["制裁"]},
+            "de_escalation": {"weight": -1, "en": ["TALKS"], "zh": []},
+        }
+        base = compute_severity_score("quiet day", "media", "trade")
+        assert compute_severity_score(
+            "new sanctions announced", "media", "trade", severity_modifiers=modifiers
+        ) == base + 3
+        assert compute_severity_score(
+            "美国宣布制裁", "media", "trade", severity_modifiers=modifiers
+        ) == base + 3
+        modifiers["escalation"] = {"weight": 5, "en": ["tariff"], "zh": []}
+        other = {**modifiers}
+        assert compute_severity_score(
+            "tariff talks", "media", "trade", severity_modifiers=other
+        ) == base + 4
+
 
 class TestClassifySeverity:
     """Test signal-level severity classification."""
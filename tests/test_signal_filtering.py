@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime
 from pathlib import Path
 
 from analysis.signal_filtering import (
@@ -43,6 +44,36 @@ class TestLoadRawSignals:
         signals = load_raw_signals(str(tmp_path))
         assert signals == []
 
+    def test_skips_empty_and_truncated_files(self, tmp_path: Path) -> None:
+        (tmp_path / "a_empty.json").write_bytes(b"")
+        (tmp_path / "b_blank.json").write_bytes(b"  \n")
+        (tmp_path / "c_truncated.json").write_bytes(b'[{"title": "Cut')
+        (tmp_path / "d_ok.json").write_bytes(b'\n  [{"title": "Kept"}]')
+        assert load_raw_signals(str(tmp_path), max_workers=1) == [{"title": "Kept"}]
+
+    def test_ignores_directories_and_other_files(self, tmp_path: Path) -> None:
+        (tmp_path / "archive.json").mkdir()
+        (tmp_path / "notes.txt").write_text("[]", encoding="utf-8")
+        (tmp_path / "news.json").write_text('[{"title": "Only"}]', encoding="utf-8")
+        assert load_raw_signals(str(tmp_path)) == [{"title": "Only"}]
+
+    def test_parallel_load_keeps_file_order(self, tmp_path: Path) -> None:
+        for i in range(6):
+            with open(tmp_path / f"feed_{i}.json", "w") as f:
+                json.dump([{"title": f"Signal {i}a"}, {"title": f"Signal {i}b"}], f)
+        serial = load_raw_signals(str(tmp_path), max_workers=1)
+        parallel = load_raw_signals(str(tmp_path), max_workers=4)
+        assert parallel == serial
+        assert [s["title"] for s in parallel[:3]] == ["Signal 0a", "Signal 0b", "Signal 1a"]
+
+    def test_skips_non_utf8_file(self, tmp_path: Path) -> None:
+        (tmp_path / "a_latin1.json").write_bytes('[{"title": "Caf\u00e9"}]'.encode("latin-1"))
+        (tmp_path / "b_news.json").write_text(
+            json.dumps([{"title": "中加关系"}], ensure_ascii=False), encoding="utf-8",
+        )
+        signals = load_raw_signals(str(tmp_path))
+        assert signals == [{"title": "中加关系"}]
+
 
 class TestParseSignalDate:
     def test_iso_date(self) -> None:
@@ -57,6 +88,23 @@ class TestParseSignalDate:
         assert dt is not None
         assert dt.day == 30
 
+    def test_offsets_keep_wall_clock_time(self) -> None:
+        expected = datetime(2025, 1, 30, 12, 0)
+        assert parse_signal_date({"date": "2025-01-30T12:00:00+08:00"}) == expected
+        assert parse_signal_date({"date": "2025-01-30T12:00:00Z"}) == expected
+        assert parse_signal_date({"date": "Thu, 30 Jan 2025 12:00:00 GMT"}) == expected
+
+    def test_falls_back_to_date_prefix(self) -> None:
+        assert parse_signal_date({"date": "2025-01-30 (updated)"}) == datetime(2025, 1, 30)
+        assert parse_signal_date({"date": "yesterday"}) is None
+
+    def test_caches_parsed_date_on_signal(self) -> None:
+        signal = {"date": "2025-01-30"}
+        assert parse_signal_date(signal) == datetime(2025, 1, 30)
+        assert signal["_parsed_date"] == datetime(2025, 1, 30)
+        signal["date"] = "not re-parsed"
+        assert parse_signal_date(signal) == datetime(2025, 1, 30)
+
     def test_bilingual_date(self) -> None:
         dt = parse_signal_date({"date": {"en": "2025-01-30", "zh": "2025-01-30"}})
         assert dt is not None
@@ -150,6 +198,12 @@ class TestIsBilateral:
             china_keywords=["beijing"],
         )
 
+    def test_keywords_match_literally(self) -> None:
+        signal = {"title": "Canada (CA) and China talks"}
+        assert is_bilateral(signal, canada_keywords=["(ca)"], china_keywords=["china"])
+        assert not is_bilateral(signal, canada_keywords=["c.nada"], china_keywords=["china"])
+        assert not is_bilateral(signal, canada_keywords=[], china_keywords=["china"])
+
 
 class TestExtractSignalText:
     def test_string_fields(self) -> None:
@@ -175,6 +229,13 @@ class TestExtractSignalText:
         assert "加拿大" in title
         assert "正文内容" in full
 
+    def test_cached_on_signal_for_later_filters(self) -> None:
+        signal = {"title": "Canada China trade talks", "body": "Ministers met."}
+        first = _extract_signal_text(signal)
+        assert signal["_signal_text"] == first
+        signal["title"] = "changed"
+        assert _extract_signal_text(signal) == first
+
 
 class TestChineseLowValuePatterns:
     def test_weather_penalty(self) -> None:
@@ -410,3 +471,16 @@ class TestFilterAndPrioritize:
         result = filter_and_prioritize_signals(signals, "2025-01-30")
         assert len(result) <= 75
         assert len(result) >= 1
+
+    def test_widens_window_until_min_signals(self) -> None:
+        signals = [
+            {"title": f"China item {i}", "date": date, "source": f"Src{i}"}
+            for i, date in enumerate(
+                ["2025-01-29", "2025-01-20", "2025-01-30", "2025-01-25", "2024-12-01"]
+            )
+        ]
+        result = filter_and_prioritize_signals(
+            signals, "2025-01-30", min_signals=3, windows_hours=(48, 168, 720),
+        )
+        # 48h holds 2, 168h holds 3: input order kept, the 720h window unused.
+        assert [s["title"] for s in result] == ["China item 0", "China item 2", "China item 3"]
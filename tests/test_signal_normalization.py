@@ -5,6 +5,7 @@ from __future__ import annotations
 from unittest.mock import patch
 
 from analysis.signal_normalization import (
+    _build_implications,
     _validate_summary,
     extract_quote,
     generate_implications,
@@ -31,6 +32,20 @@ class TestToBilingual:
         result = to_bilingual(None)
         assert result == {"en": "", "zh": ""}
 
+    def test_complete_dict_returned_as_is(self) -> None:
+        value = {"en": "Hello", "zh": "你好"}
+        assert to_bilingual(value) is value
+
+    def test_english_only_dict_gets_empty_zh(self) -> None:
+        value = {"en": "Hello"}
+        assert to_bilingual(value) == {"en": "Hello", "zh": ""}
+        assert value == {"en": "Hello"}
+
+    def test_empty_values_are_independent(self) -> None:
+        first = to_bilingual("")
+        first["zh"] = "已翻译"
+        assert to_bilingual("") == {"en": "", "zh": ""}
+
 
 class TestGenerateImplications:
     def test_diplomatic_critical(self) -> None:
@@ -69,6 +84,46 @@ class TestGenerateImplications:
         )
         assert result["what_to_watch"]["en"] == "Monitor trade"
 
+    def test_falls_back_to_diplomatic_and_default_tier(self) -> None:
+        result = generate_implications(
+            "military", "high",
+            impact_templates={"diplomatic": {"en": "Diplomatic impact", "zh": "外交影响"}},
+            watch_templates={"default": {"en": {"diplomatic": "Monitor"}, "zh": {}}},
+        )
+        assert result == {
+            "canada_impact": {"en": "Diplomatic impact", "zh": "外交影响"},
+            "what_to_watch": {"en": "Monitor", "zh": ""},
+        }
+
+    def test_empty_templates(self) -> None:
+        result = generate_implications("trade", "low", impact_templates={}, watch_templates={})
+        assert result == {
+            "canada_impact": {"en": "", "zh": ""},
+            "what_to_watch": {"en": "", "zh": ""},
+        }
+
+
+class TestBuildImplications:
+    _IMPACTS = {"trade": {"en": "Trade impact", "zh": "贸易影响"}}
+    _WATCHES = {"default": {"en": {"trade": "Monitor trade"}, "zh": {"trade": "跟踪贸易"}}}
+
+    def test_generated_when_missing(self) -> None:
+        signal = {"category": "trade", "severity": "low"}
+        result = _build_implications(signal, self._IMPACTS, self._WATCHES)
+        assert result["canada_impact"]["en"] == "Trade impact"
+        assert result["what_to_watch"] == {"en": "Monitor trade", "zh": "跟踪贸易"}
+
+    def test_fills_existing_without_mutating_it(self) -> None:
+        existing = {"canada_impact": "Farmers hit", "what_to_watch": "", "note": "kept"}
+        signal = {"category": "trade", "severity": "low", "implications": existing}
+        result = _build_implications(signal, self._IMPACTS, self._WATCHES)
+        assert result == {
+            "canada_impact": {"en": "Farmers hit", "zh": "Farmers hit"},
+            "what_to_watch": {"en": "Monitor trade", "zh": "跟踪贸易"},
+            "note": "kept",
+        }
+        assert existing["what_to_watch"] == ""
+
 
 class TestExtractQuote:
     def test_finds_quote(self) -> None:
@@ -178,6 +233,11 @@ class TestIsPrimarilyChinese:
     def test_empty(self) -> None:
         assert not is_primarily_chinese("")
 
+    def test_threshold_ignores_whitespace(self) -> None:
+        assert is_primarily_chinese("中国贸易 policy")
+        assert not is_primarily_chinese("Canada and China sign trade deal 中国")
+        assert not is_primarily_chinese(" \u3000\n")
+
 
 class TestTranslateSignalsBatch:
     @patch("analysis.signal_normalization.translate_to_chinese")
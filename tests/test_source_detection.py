@@ -28,6 +28,15 @@ class TestTranslateSourceName:
         result = translate_source_name("TestSource", {"TestSource": "Translated"})
         assert result["en"] == "Translated"
 
+    def test_repeated_lookups_return_independent_dicts(self) -> None:
+        first = translate_source_name("新华社")
+        first["zh"] = "mutated"
+        assert translate_source_name("新华社") == {"en": "Xinhua", "zh": "新华社"}
+
+    def test_cache_is_per_translation_table(self) -> None:
+        assert translate_source_name("Wire", {"Wire": "Wire A"})["en"] == "Wire A"
+        assert translate_source_name("Wire", {"Wire": "Wire B"})["en"] == "Wire B"
+
 
 class TestIsChineseSource:
     def test_language_marker(self) -> None:
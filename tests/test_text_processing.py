@@ -10,6 +10,7 @@ from analysis.text_processing import (
     score_sentence,
     split_sentences,
     summarize_body,
+    title_word_set,
 )
 
 
@@ -29,6 +30,12 @@ class TestSplitSentences:
 
 
 class TestScoreSentence:
+    def test_repeated_title_words_count_once(self) -> None:
+        title = "Canola tariffs"
+        once = "Officials discussed canola during the long meeting in Ottawa."
+        twice = "Officials discussed canola canola during the meeting in Ottawa."
+        assert score_sentence(once, title, 1, 4) == score_sentence(twice, title, 1, 4)
+
     def test_title_overlap_boosts_score(self) -> None:
         title = "China imposes trade sanctions"
         with_overlap = "China announced new trade restrictions on imports."
@@ -67,6 +74,16 @@ class TestScoreSentence:
         late = score_sentence(sent, title, 5, 10)
         assert early > late
 
+    def test_precomputed_title_words_match(self) -> None:
+        title = "China imposes trade sanctions on Canadian canola"
+        sent = "Beijing said the canola sanctions would remain in place."
+        words = title_word_set(title)
+        assert words == {"china", "imposes", "trade", "sanctions", "canadian", "canola"}
+        assert isinstance(words, frozenset)
+        assert score_sentence(sent, title, 1, 4, title_words=words) == score_sentence(
+            sent, title, 1, 4,
+        )
+
 
 class TestExtractListItems:
     def test_extract_headings_and_items(self) -> None:
@@ -78,6 +95,10 @@ class TestExtractListItems:
     def test_empty_text(self) -> None:
         assert extract_list_items("") == []
 
+    def test_strips_lines_and_ignores_untagged(self) -> None:
+        text = "  [heading] Trade  \r\nIntro text\n\t[item] Canola\n[item]   \n[items] nope"
+        assert extract_list_items(text) == ["Trade", "Canola"]
+
 
 class TestIsListHeadline:
     def test_detects_list(self) -> None:
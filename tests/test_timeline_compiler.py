@@ -231,6 +231,18 @@ class TestMarkMilestone:
         assert data["signals"][0]["is_milestone"] is True
         assert data["signals"][0]["timeline_category"] == "crisis"
 
+    def test_marks_signal_with_escaped_id(self, tmp_path: Path) -> None:
+        daily = tmp_path / "daily" / "2025-01-30"
+        daily.mkdir(parents=True)
+        (tmp_path / "daily" / "notes.txt").write_text("", encoding="utf-8")
+        # json.dump escapes non-ASCII, so the raw bytes differ from the id.
+        with open(daily / "briefing.json", "w") as f:
+            json.dump({"signals": [{"id": "加中-talks"}]}, f)
+
+        assert mark_signal_as_milestone("加中-talks", archive_dir=str(tmp_path)) is True
+        data = json.loads((daily / "briefing.json").read_text(encoding="utf-8"))
+        assert data["signals"][0]["is_milestone"] is True
+
     def test_signal_not_found(self, tmp_path: Path) -> None:
         daily = tmp_path / "daily" / "2025-01-30"
         daily.mkdir(parents=True)
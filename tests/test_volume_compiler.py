@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import json
+from datetime import date
 from pathlib import Path
 
-from analysis.volume_compiler import compile_volume, write_volume
+from analysis.volume_compiler import _load_daily_briefings, compile_volume, write_volume
 
 
 class TestCompileVolume:
@@ -101,3 +102,23 @@ class TestWriteVolume:
             data = json.load(f)
         assert data["volume_number"] == 1
         assert data["signal_count"] == 42
+
+
+class TestLoadDailyBriefings:
+    """Test loading a month of archived briefings."""
+
+    def test_parallel_load_keeps_date_order(self, tmp_path: Path) -> None:
+        daily_dir = tmp_path / "daily"
+        for day in ["2025-01-03", "2025-01-01", "2025-01-20"]:
+            (daily_dir / day).mkdir(parents=True)
+            (daily_dir / day / "briefing.json").write_text(json.dumps({"date": day}))
+        (daily_dir / "2025-01-05.json").write_text(json.dumps({"date": "flat"}))
+        (daily_dir / "2025-01-09.json").write_bytes(b"{broken")
+
+        start, end = date(2025, 1, 1), date(2025, 1, 31)
+        serial = _load_daily_briefings(start, end, str(tmp_path), max_workers=1)
+        parallel = _load_daily_briefings(start, end, str(tmp_path), max_workers=4)
+        assert parallel == serial
+        assert [b["_date"] for b in parallel] == [
+            "2025-01-01", "2025-01-03", "2025-01-05", "2025-01-20",
+        ]